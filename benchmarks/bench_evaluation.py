@@ -0,0 +1,60 @@
+import pandas as pd
+
+from benchmarks.fakes import StubEmbeddings, StubLLM, make_description
+from benchmarks.harness import parse_args, run_cases
+from utilities.gpt_parser import evaluate_job_matches
+from utilities.text_cleaning import normalize_descriptions
+
+# --------------------------------------------
+# Benchmark of evaluate_job_matches with stub embeddings and LLM (no API calls, cache disabled)
+# Pre-ranking is turned off so every job goes through prompt building, the LLM and validation
+# Run from the project root: python -m benchmarks.bench_evaluation [--sizes 10 100 1000 10000]
+# --------------------------------------------
+LLM_LATENCY = 0.02
+EMBEDDING_LATENCY = 0.01
+
+RESUME_TEXT = "\n".join([
+    "Jane Doe - Senior Software Engineer",
+    "Experience: 7 years building Python services on AWS, PostgreSQL and Kafka.",
+    "Led the migration of a monolith to containerised microservices running on ECS.",
+    "Skills: Python, Go, SQL, Docker, CI/CD, observability, REST and gRPC APIs.",
+    "Education: BSc Computer Science.",
+] * 20)
+
+
+def make_jobs(size):
+    jobs_df = pd.DataFrame({
+        "Platform": ["LinkedIn", "Indeed"] * (size // 2) + ["LinkedIn"] * (size % 2),
+        "Job Title": [f"Software Engineer {i}" for i in range(size)],
+        "Company": [f"Company {i % 97}" for i in range(size)],
+        "Location": "New York, NY",
+        "Job Description": [make_description(i) for i in range(size)],
+        "Job URL": [f"https://example.com/jobs/{i}" for i in range(size)],
+    })
+    jobs_df["Job Description"] = normalize_descriptions(jobs_df["Job Description"])
+    return jobs_df
+
+
+def evaluation_case(batch_size):
+    def run(size):
+        jobs_df = make_jobs(size)
+        llm = StubLLM(latency=LLM_LATENCY)
+        match_df = evaluate_job_matches(jobs_df, RESUME_TEXT, llm=llm, embeddings=StubEmbeddings(EMBEDDING_LATENCY),
+                                        use_cache=False, batch_size=batch_size, prerank_top_k=None)
+        return len(match_df), llm.ready_at
+
+    return run
+
+
+def main(argv=None):
+    args = parse_args("evaluate_job_matches benchmark (stub LLM and embeddings)", argv=argv)
+    print(f"Stub latency: LLM {LLM_LATENCY * 1000:.0f} ms, embeddings {EMBEDDING_LATENCY * 1000:.0f} ms per request")
+    cases = {
+        "evaluate (per-job requests)": evaluation_case(batch_size=1),
+        "evaluate (batched requests)": evaluation_case(batch_size=5),
+    }
+    return run_cases(cases, args.sizes, args.json)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,122 @@
+import argparse
+import ast
+import json
+import os
+import re
+import subprocess
+import sys
+
+# --------------------------------------------
+# Import-time report for the Streamlit app's cold start (python -X importtime)
+# - startup: the modules main.py imports at top level, i.e. what every new container pays before
+#   the first widget renders
+# - deferred: the heavy modules main.py only imports once scraping or evaluation starts,
+#   measured on top of the startup imports
+# Also flags heavy third-party packages that leak into the startup imports
+# Run from the project root: python -m benchmarks.bench_imports [--repeats 3] [--json imports.json]
+# --------------------------------------------
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+MAIN_SCRIPT = os.path.join(PROJECT_ROOT, "main.py")
+REPEATS = 3
+TOP_N = 10
+
+DEFERRED_MODULES = (
+    "utilities.linkedin_scraper",
+    "utilities.indeed_scraper",
+    "utilities.resume_reader",
+    "utilities.gpt_parser",
+)
+HEAVY_PACKAGES = ("selenium", "apify_client", "langchain", "langchain_core", "langchain_community",
+                  "langchain_openai", "faiss", "openai", "tiktoken", "pypdf")
+
+# "import time:   self [us] | cumulative | imported package" lines written by -X importtime
+IMPORTTIME_PATTERN = re.compile(r"^import time:\s+(\d+) \|\s+(\d+) \|( +)(\S+)$")
+
+
+# Modules main.py imports at module level (imports inside functions and branches are deferred)
+def startup_modules(script=MAIN_SCRIPT):
+    with open(script, encoding="utf-8") as script_file:
+        tree = ast.parse(script_file.read())
+    modules = []
+    for node in tree.body:
+        if isinstance(node, ast.Import):
+            modules.extend(alias.name for alias in node.names)
+        elif isinstance(node, ast.ImportFrom) and node.module:
+            modules.append(node.module)
+    return list(dict.fromkeys(modules))
+
+
+# --------------------------------------------
+# Imports `setup` and then `modules` in a fresh interpreter
+# Returns (indent, module, cumulative microseconds) for every module first imported by `modules`;
+# nested imports are indented, and the least indented entries add up to the total
+# --------------------------------------------
+def import_times(modules, setup=()):
+    code = "".join(f"import {module}\n" for module in setup) + "import sys; sys.stderr.write('--- measure ---\\n')\n"
+    code += "".join(f"import {module}\n" for module in modules)
+    completed = subprocess.run([sys.executable, "-X", "importtime", "-c", code], cwd=PROJECT_ROOT,
+                               capture_output=True, text=True)
+    if completed.returncode != 0:
+        raise RuntimeError(completed.stderr.strip().splitlines()[-1] if completed.stderr.strip() else "import failed")
+
+    measured = completed.stderr.split("--- measure ---\n", 1)[1]
+    entries = []
+    for line in measured.splitlines():
+        match = IMPORTTIME_PATTERN.match(line)
+        if match:
+            entries.append((len(match.group(3)), match.group(4), int(match.group(2))))
+    return entries
+
+
+def summarize(entries):
+    if not entries:
+        return {"total_ms": 0.0, "top_level": {}, "packages": []}
+    top_indent = min(indent for indent, _, _ in entries)
+    top_level = {name: cumulative / 1000 for indent, name, cumulative in entries if indent == top_indent}
+    packages = sorted({name.split(".")[0] for _, name, _ in entries})
+    return {"total_ms": round(sum(top_level.values()), 1), "top_level": top_level, "packages": packages}
+
+
+# Best (lowest total) of `repeats` runs, since import times are noisy
+def best_of(modules, setup=(), repeats=REPEATS):
+    return min((summarize(import_times(modules, setup)) for _ in range(repeats)), key=lambda run: run["total_ms"])
+
+
+def run(repeats=REPEATS):
+    modules = startup_modules()
+    startup = best_of(modules, repeats=repeats)
+    deferred = {module: best_of([module], setup=modules, repeats=repeats)["total_ms"] for module in DEFERRED_MODULES}
+    return {
+        "startup_modules": modules,
+        "startup_ms": startup["total_ms"],
+        "slowest_startup_imports": dict(sorted(startup["top_level"].items(), key=lambda item: -item[1])[:TOP_N]),
+        "heavy_packages_at_startup": [package for package in HEAVY_PACKAGES if package in startup["packages"]],
+        "deferred_ms": deferred,
+    }
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Import-time report for the Streamlit app's cold start")
+    parser.add_argument("--repeats", type=int, default=REPEATS, help="Runs per measurement (best is reported)")
+    parser.add_argument("--json", help="Also write the report to this JSON file (to compare runs)")
+    args = parser.parse_args(argv)
+
+    report = run(args.repeats)
+    print(f"Startup imports of main.py ({', '.join(report['startup_modules'])}): "
+          f"{report['startup_ms']:.0f} ms (best of {args.repeats})")
+    for module, milliseconds in report["slowest_startup_imports"].items():
+        print(f"  {module:<40} {milliseconds:8.1f} ms")
+    if report["heavy_packages_at_startup"]:
+        print(f"WARNING: heavy packages imported at startup: {', '.join(report['heavy_packages_at_startup'])}")
+    print("Deferred imports (paid when scraping/evaluation starts):")
+    for module, milliseconds in report["deferred_ms"].items():
+        print(f"  {module:<40} {milliseconds:8.1f} ms")
+
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as json_file:
+            json.dump(report, json_file, indent=2)
+    return report
+
+
+if __name__ == "__main__":
+    main()
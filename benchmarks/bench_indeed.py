@@ -0,0 +1,35 @@
+import time
+
+from benchmarks.fakes import FakeApifyClient
+from benchmarks.harness import parse_args, run_cases
+from utilities.indeed_scraper import stream_indeed
+
+# --------------------------------------------
+# Benchmark of the Indeed scraper against a fake Apify client (no network, no API key)
+# Drives stream_indeed, the streaming core of scrape_indeed, with a short poll interval and
+# reports how fast items that land in the actor's dataset come out as cleaned rows
+# Run from the project root: python -m benchmarks.bench_indeed [--sizes 10 100 1000 10000]
+# --------------------------------------------
+ITEMS_PER_SECOND = 2000.0
+REQUEST_LATENCY = 0.01
+POLL_INTERVAL = 0.05
+
+
+def run_indeed(size):
+    client = FakeApifyClient(size, items_per_second=ITEMS_PER_SECOND, request_latency=REQUEST_LATENCY)
+    jobs, ready_at = 0, []
+    for chunk in stream_indeed("Software Engineer", "New York", size, "No", "Any time", "Full-time",
+                               client=client, poll_interval=POLL_INTERVAL):
+        jobs += len(chunk)
+        ready_at.extend([time.perf_counter()] * len(chunk))
+    return jobs, ready_at
+
+
+def main(argv=None):
+    args = parse_args("Indeed scraper benchmark (fake Apify client)", argv=argv)
+    print(f"Fake actor: {ITEMS_PER_SECOND:.0f} items/s, {REQUEST_LATENCY * 1000:.0f} ms per dataset request")
+    return run_cases({"indeed stream (fake apify)": run_indeed}, args.sizes, args.json)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,152 @@
+import functools
+import html
+import json
+import os
+import tempfile
+import threading
+import time
+from http.server import SimpleHTTPRequestHandler, ThreadingHTTPServer
+
+from selenium import webdriver
+from selenium.common.exceptions import WebDriverException
+
+from benchmarks.fakes import make_description
+from benchmarks.harness import parse_args, run_cases
+from utilities.chromedriver_launch import build_options
+from utilities.linkedin_scraper import iter_jobs, iter_jobs_bulk
+
+# --------------------------------------------
+# Benchmark of the LinkedIn extraction against fixture result pages served from a local static server
+# The fixture pages reproduce the markup of a LinkedIn search that the scraper's locators target (job cards,
+# description pane, pagination and the guest job-posting endpoint), filled with generated job data
+# Both extraction modes are measured: "click" (iter_jobs, as used by extract_jobs) and "bulk" (iter_jobs_bulk)
+# Needs a local Chrome; no LinkedIn account or network access
+# Run from the project root: python -m benchmarks.bench_linkedin [--sizes 10 100 1000]
+# --------------------------------------------
+DEFAULT_SIZES = (10, 100, 1000)
+JOBS_PER_PAGE = 25
+POLL_INTERVAL = 0.05
+
+CARD_TEMPLATE = """<li data-occludable-job-id="{job_id}">
+  <div class="job-card-container">
+    <a href="/jobs/view/{job_id}"><span aria-hidden="true">{title}</span></a>
+    <div class="artdeco-entity-lockup__subtitle ember-view"><span dir="ltr">{company}</span></div>
+    <div class="artdeco-entity-lockup__caption ember-view"><span dir="ltr">{location}</span></div>
+  </div>
+</li>"""
+
+PAGE_TEMPLATE = """<!DOCTYPE html>
+<html><head><title>Software Engineer jobs | LinkedIn</title></head>
+<body>
+<ul class="scaffold-layout__list-container">
+{cards}
+</ul>
+<div class="jobs-search__job-details"><div class="mt4"><p></p></div></div>
+<button aria-label="View next page" onclick="location.href='{next_page}'" {disabled}>Next</button>
+<script>
+const descriptions = {descriptions};
+document.querySelectorAll("li[data-occludable-job-id] a").forEach((link) => link.addEventListener("click", (event) => {{
+    event.preventDefault();
+    const jobId = link.closest("li").getAttribute("data-occludable-job-id");
+    history.replaceState(null, "", "?currentJobId=" + jobId);
+    setTimeout(() => {{ document.querySelector("div.mt4 > p").textContent = descriptions[jobId]; }}, 20);
+}}));
+</script>
+</body></html>"""
+
+POSTING_TEMPLATE = """<section class="top-card-layout">
+  <h2 class="top-card-layout__title">{title}</h2>
+  <a class="topcard__org-name-link">{company}</a>
+  <span class="topcard__flavor--bullet">{location}</span>
+</section>
+<div class="show-more-less-html__markup">{description}</div>"""
+
+
+def make_job(i):
+    return {
+        "job_id": str(4_000_000_000 + i),
+        "title": f"Software Engineer {i}",
+        "company": f"Company {i % 97}",
+        "location": "New York, NY",
+        "description": f"Software Engineer {i}. " + make_description(i),
+    }
+
+
+# --------------------------------------------
+# Writes the fixture site for num_jobs jobs into root:
+# - jobs/search/page-N.html: result pages of JOBS_PER_PAGE cards
+# - jobs-guest/jobs/api/jobPosting/<id>: the posting page of every job
+# --------------------------------------------
+def write_fixtures(root, num_jobs):
+    search_dir = os.path.join(root, "jobs", "search")
+    posting_dir = os.path.join(root, "jobs-guest", "jobs", "api", "jobPosting")
+    os.makedirs(search_dir, exist_ok=True)
+    os.makedirs(posting_dir, exist_ok=True)
+
+    jobs = [make_job(i) for i in range(num_jobs)]
+    pages = [jobs[start:start + JOBS_PER_PAGE] for start in range(0, num_jobs, JOBS_PER_PAGE)]
+    for number, page_jobs in enumerate(pages, start=1):
+        cards = "\n".join(CARD_TEMPLATE.format(**{key: html.escape(value) for key, value in job.items()})
+                          for job in page_jobs)
+        # "</" is escaped so descriptions containing </script> cannot end the inline script
+        descriptions = json.dumps({job["job_id"]: job["description"] for job in page_jobs}).replace("</", "<\\/")
+        page = PAGE_TEMPLATE.format(cards=cards, descriptions=descriptions, next_page=f"page-{number + 1}.html",
+                                    disabled="disabled" if number == len(pages) else "")
+        with open(os.path.join(search_dir, f"page-{number}.html"), "w", encoding="utf-8") as page_file:
+            page_file.write(page)
+
+    for job in jobs:
+        posting = POSTING_TEMPLATE.format(title=html.escape(job["title"]), company=html.escape(job["company"]),
+                                          location=html.escape(job["location"]), description=job["description"])
+        with open(os.path.join(posting_dir, job["job_id"]), "w", encoding="utf-8") as posting_file:
+            posting_file.write(posting)
+
+
+class QuietHandler(SimpleHTTPRequestHandler):
+    def log_message(self, format, *args):
+        pass
+
+
+# Serves root on a free local port in a background thread; returns (server, base_url)
+def start_server(root):
+    server = ThreadingHTTPServer(("127.0.0.1", 0), functools.partial(QuietHandler, directory=root))
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server, f"http://127.0.0.1:{server.server_port}"
+
+
+def extraction_case(driver, base_url, iterate):
+    def run(size):
+        driver.get(f"{base_url}/jobs/search/page-1.html")
+        jobs, ready_at = 0, []
+        for _ in iterate(driver, size, poll_interval=POLL_INTERVAL):
+            jobs += 1
+            ready_at.append(time.perf_counter())
+        return jobs, ready_at
+
+    return run
+
+
+def main(argv=None):
+    args = parse_args("LinkedIn extraction benchmark (fixture pages, local server)", DEFAULT_SIZES, argv)
+    try:
+        driver = webdriver.Chrome(options=build_options())
+    except WebDriverException as e:
+        print(f"Skipping LinkedIn benchmark: Chrome could not be started ({e.msg})")
+        return []
+
+    with tempfile.TemporaryDirectory() as root:
+        write_fixtures(root, max(args.sizes))
+        server, base_url = start_server(root)
+        try:
+            cases = {
+                "linkedin click (iter_jobs)": extraction_case(driver, base_url, iter_jobs),
+                "linkedin bulk (iter_jobs_bulk)": extraction_case(driver, base_url, iter_jobs_bulk),
+            }
+            return run_cases(cases, args.sizes, args.json)
+        finally:
+            server.shutdown()
+            driver.quit()
+
+
+if __name__ == "__main__":
+    main()
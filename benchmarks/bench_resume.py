@@ -0,0 +1,71 @@
+import functools
+import time
+
+from benchmarks.harness import parse_args, run_cases
+from utilities.resume_reader import MAX_WORKERS, read_pdf
+
+# --------------------------------------------
+# Benchmark of PDF resume extraction, sequential vs. split across worker processes
+# Sizes are page counts; every page is a full page of text, as in a dense resume
+# Used to pick resume_reader.PARALLEL_MIN_PAGES (the process pool only pays off for long documents)
+# Run from the project root: python -m benchmarks.bench_resume [--sizes 2 8 32 128]
+# --------------------------------------------
+DEFAULT_SIZES = (2, 8, 32, 128)
+LINES_PER_PAGE = 50
+
+LINE = "Led the migration of a monolith to containerised Python microservices on AWS (ECS, RDS, SQS)."
+
+
+# --------------------------------------------
+# Builds a PDF of `pages` text pages from raw objects (no PDF writer dependency)
+# --------------------------------------------
+@functools.lru_cache(maxsize=None)
+def make_pdf(pages):
+    text = "".join(f"({LINE} {line}) Tj T* " for line in range(LINES_PER_PAGE))
+    content = f"BT /F1 9 Tf 12 TL 40 800 Td {text}ET".encode("latin-1")
+
+    # 1: catalog, 2: page tree, 3: font, then a page and its content stream per page
+    objects = [b"<< /Type /Catalog /Pages 2 0 R >>", None,
+               b"<< /Type /Font /Subtype /Type1 /BaseFont /Helvetica >>"]
+    kids = []
+    for _ in range(pages):
+        page_number = len(objects) + 1
+        kids.append(f"{page_number} 0 R")
+        objects.append(f"<< /Type /Page /Parent 2 0 R /MediaBox [0 0 595 842] /Contents {page_number + 1} 0 R "
+                       f"/Resources << /Font << /F1 3 0 R >> >> >>".encode("latin-1"))
+        objects.append(b"<< /Length %d >>\nstream\n%s\nendstream" % (len(content), content))
+    objects[1] = f"<< /Type /Pages /Kids [{' '.join(kids)}] /Count {pages} >>".encode("latin-1")
+
+    pdf, offsets = bytearray(b"%PDF-1.4\n"), []
+    for number, body in enumerate(objects, start=1):
+        offsets.append(len(pdf))
+        pdf += b"%d 0 obj\n%s\nendobj\n" % (number, body)
+    xref = len(pdf)
+    pdf += b"xref\n0 %d\n0000000000 65535 f \n" % (len(objects) + 1)
+    pdf += b"".join(b"%010d 00000 n \n" % offset for offset in offsets)
+    pdf += b"trailer\n<< /Size %d /Root 1 0 R >>\nstartxref\n%d\n%%%%EOF\n" % (len(objects) + 1, xref)
+    return bytes(pdf)
+
+
+def extraction_case(parallel):
+    def run(size):
+        # min_pages=1 so the parallel case always uses the process pool
+        text = read_pdf(make_pdf(size), parallel=parallel, min_pages=1)
+        return text.count(LINE) // LINES_PER_PAGE, [time.perf_counter()]
+
+    return run
+
+
+def main(argv=None):
+    args = parse_args("PDF resume extraction benchmark (generated PDFs, sizes are pages)", DEFAULT_SIZES, argv)
+    if MAX_WORKERS < 2:
+        print("Only one CPU available: the parallel case extracts sequentially")
+    cases = {
+        "resume pdf sequential": extraction_case(parallel=False),
+        "resume pdf parallel": extraction_case(parallel=True),
+    }
+    return run_cases(cases, args.sizes, args.json)
+
+
+if __name__ == "__main__":
+    main()
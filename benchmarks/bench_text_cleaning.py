@@ -0,0 +1,76 @@
+import random
+import re
+import time
+
+import pandas as pd
+
+from utilities.text_cleaning import clean_job_description, normalize_descriptions
+
+# --------------------------------------------
+# Micro-benchmark for job description cleaning
+# Compares the original per-row Series.apply with uncompiled regexes against
+# the current scalar cleaner (via apply) and the column cleaner normalize_descriptions
+# Run from the project root: python -m benchmarks.bench_text_cleaning
+# --------------------------------------------
+ROWS = 10_000
+REPEATS = 3
+
+PARAGRAPHS = [
+    "We are looking for a <b>Software Engineer</b> to join our growing team &amp; help build scalable services.",
+    "<ul><li>5+ years of Python</li><li>Experience with AWS &amp; Kubernetes</li><li>SQL&nbsp;skills</li></ul>",
+    "<p>Benefits include health insurance, 401(k) matching &#38; flexible hours.</p>",
+    "<script type='text/javascript'>window.dataLayer = window.dataLayer || [];</script>",
+    "<style>.job-body { font-size: 14px; }</style><!-- tracking pixel -->",
+    "<div class=\"requirements\"><h3>Requirements</h3>\n\n<p>Strong communication skills.</p></div>",
+]
+
+
+def make_descriptions(rows=ROWS, seed=42):
+    rng = random.Random(seed)
+    return pd.Series(["\n".join(rng.choices(PARAGRAPHS, k=rng.randint(4, 12))) for _ in range(rows)])
+
+
+# The cleaner as it was originally implemented in indeed_scraper
+def legacy_clean_job_description(text):
+    text = re.sub(r"<.*?>", " ", text)
+    text = re.sub(r"\s+", " ", text).strip()
+    return text
+
+
+def best_of(fn, repeats=REPEATS):
+    timings = []
+    for _ in range(repeats):
+        start = time.perf_counter()
+        fn()
+        timings.append(time.perf_counter() - start)
+    return min(timings)
+
+
+def run(rows=ROWS):
+    descriptions = make_descriptions(rows)
+    cases = {
+        "legacy apply (uncompiled re)": lambda: descriptions.apply(legacy_clean_job_description),
+        "apply (clean_job_description)": lambda: descriptions.apply(clean_job_description),
+        "column normalize_descriptions": lambda: normalize_descriptions(descriptions),
+    }
+
+    results = {}
+    for name, fn in cases.items():
+        seconds = best_of(fn)
+        results[name] = {
+            "seconds": seconds,
+            "rows_per_second": rows / seconds,
+            "seconds_per_10k": seconds * 10_000 / rows,
+        }
+    return results
+
+
+def main():
+    print(f"Cleaning {ROWS} descriptions (best of {REPEATS})")
+    for name, result in run().items():
+        print(f"{name:<36} {result['seconds_per_10k'] * 1000:8.1f} ms / 10k   "
+              f"{result['rows_per_second']:10.0f} rows/s")
+
+
+if __name__ == "__main__":
+    main()
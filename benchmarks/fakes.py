@@ -0,0 +1,128 @@
+import json
+import re
+import threading
+import time
+import zlib
+from types import SimpleNamespace
+
+import numpy as np
+from langchain_core.embeddings import Embeddings
+
+from benchmarks.bench_text_cleaning import PARAGRAPHS
+
+# --------------------------------------------
+# Offline stand-ins for the external services, with configurable latency
+# - StubEmbeddings: deterministic embedding model
+# - StubLLM: chat model answering the evaluation prompts (single and batched) with valid JSON
+# - FakeApifyClient: Apify client whose actor run lands items at a fixed rate
+# --------------------------------------------
+BATCH_JOB_PATTERN = re.compile(r"^### Job (\d+)$", re.MULTILINE)
+
+
+def make_description(seed):
+    return "\n".join(PARAGRAPHS[(seed + i) % len(PARAGRAPHS)] for i in range(4 + seed % 8))
+
+
+class StubEmbeddings(Embeddings):
+    model = "stub-embedding"
+
+    def __init__(self, latency=0.0, dimensions=64):
+        self.latency = latency
+        self.dimensions = dimensions
+
+    def _vector(self, text):
+        rng = np.random.default_rng(zlib.crc32(text.encode("utf-8")))
+        return rng.standard_normal(self.dimensions).tolist()
+
+    def embed_documents(self, texts):
+        time.sleep(self.latency)
+        return [self._vector(text) for text in texts]
+
+    def embed_query(self, text):
+        time.sleep(self.latency)
+        return self._vector(text)
+
+
+# --------------------------------------------
+# Answers after `latency` seconds; records the completion time of every job it answered in `ready_at`
+# --------------------------------------------
+class StubLLM:
+    model_name = "stub-llm"
+
+    def __init__(self, latency=0.0):
+        self.latency = latency
+        self.ready_at = []
+        self._lock = threading.Lock()
+
+    def invoke(self, prompt):
+        time.sleep(self.latency)
+        job_indices = [int(index) for index in BATCH_JOB_PATTERN.findall(prompt)]
+        match = {
+            "match_percentage": zlib.crc32(prompt.encode("utf-8")) % 101,
+            "skill_gaps": "Kubernetes, Terraform",
+            "suggestions": "Highlight production Python and cloud experience.",
+        }
+        if job_indices:
+            content = json.dumps({"results": [{"job_index": index, **match} for index in job_indices]})
+        else:
+            content = json.dumps(match)
+
+        finished = time.perf_counter()
+        with self._lock:
+            self.ready_at.extend([finished] * max(1, len(job_indices)))
+        return SimpleNamespace(content=content, usage_metadata=None)
+
+
+# --------------------------------------------
+# Apify client whose actor run produces `total` items at `items_per_second`
+# Every list_items call takes `request_latency` seconds, like a round-trip to the API
+# The run ends with `final_status` once all items have landed
+# Implements only the calls stream_indeed makes
+# --------------------------------------------
+class FakeApifyClient:
+    def __init__(self, total, items_per_second=2000.0, request_latency=0.01, final_status="SUCCEEDED"):
+        self.total = total
+        self.final_status = final_status
+        self.items_per_second = items_per_second
+        self.request_latency = request_latency
+        self.started = None
+        self.aborted = False
+
+    def landed(self):
+        return min(self.total, int((time.perf_counter() - self.started) * self.items_per_second))
+
+    def actor(self, actor_id):
+        return SimpleNamespace(start=self._start)
+
+    def _start(self, run_input):
+        self.started = time.perf_counter()
+        return {"id": "run", "defaultDatasetId": "dataset"}
+
+    def run(self, run_id):
+        return SimpleNamespace(get=self._get_run, abort=self._abort)
+
+    def _get_run(self):
+        if self.aborted:
+            return {"status": "ABORTED"}
+        return {"status": self.final_status if self.landed() >= self.total else "RUNNING"}
+
+    def _abort(self):
+        self.aborted = True
+
+    def dataset(self, dataset_id):
+        return SimpleNamespace(list_items=self._list_items)
+
+    def _list_items(self, offset=0, limit=None, clean=True):
+        time.sleep(self.request_latency)
+        end = self.landed() if limit is None else min(self.landed(), offset + limit)
+        return SimpleNamespace(items=[self._item(i) for i in range(offset, end)])
+
+    @staticmethod
+    def _item(i):
+        return {
+            "title": f"Software Engineer {i}",
+            "company": f"Company {i % 97}",
+            "location": "New York, NY",
+            "description": make_description(i),
+            "job_url": f"https://www.indeed.com/viewjob?jk={i:012d}",
+        }
@@ -0,0 +1,72 @@
+import argparse
+import json
+import time
+import tracemalloc
+
+# --------------------------------------------
+# Shared measurement and reporting for the benchmark scripts
+# Every case is a function run(size) -> (jobs, ready_at), where ready_at holds, for each job,
+# the perf_counter() timestamp at which its result became available
+# --------------------------------------------
+DEFAULT_SIZES = (10, 100, 1000, 10_000)
+
+
+def percentile(values, q):
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, max(0, round(q * (len(ordered) - 1))))]
+
+
+# --------------------------------------------
+# Runs one case under tracemalloc and returns its summary:
+# - jobs_per_second: jobs produced over the wall time of the whole run
+# - p50 / p95: seconds from the start of the run until 50% / 95% of the jobs were available
+# - peak_mb: peak Python heap allocated during the run (tracemalloc slows every case by the same factor)
+# --------------------------------------------
+def measure(name, size, run):
+    tracemalloc.start()
+    start = time.perf_counter()
+    try:
+        jobs, ready_at = run(size)
+        seconds = time.perf_counter() - start
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    latencies = [timestamp - start for timestamp in ready_at]
+    return {
+        "case": name,
+        "size": size,
+        "jobs": jobs,
+        "seconds": round(seconds, 4),
+        "jobs_per_second": round(jobs / seconds, 2) if seconds else 0.0,
+        "p50": round(percentile(latencies, 0.5), 4),
+        "p95": round(percentile(latencies, 0.95), 4),
+        "peak_mb": round(peak / (1024 * 1024), 2),
+    }
+
+
+def print_report(results):
+    print(f"{'case':<32} {'size':>6} {'jobs':>6} {'seconds':>9} {'jobs/s':>9} {'p50 s':>8} {'p95 s':>8} {'peak MB':>8}")
+    for result in results:
+        print(f"{result['case']:<32} {result['size']:>6} {result['jobs']:>6} {result['seconds']:>9.3f} "
+              f"{result['jobs_per_second']:>9.1f} {result['p50']:>8.3f} {result['p95']:>8.3f} {result['peak_mb']:>8.1f}")
+
+
+# Command line shared by the benchmark scripts: --sizes 10 100 ... and --json results.json
+def parse_args(description, default_sizes=DEFAULT_SIZES, argv=None):
+    parser = argparse.ArgumentParser(description=description)
+    parser.add_argument("--sizes", type=int, nargs="+", default=list(default_sizes), help="Numbers of jobs to run")
+    parser.add_argument("--json", help="Also write the results to this JSON file (to compare runs)")
+    return parser.parse_args(argv)
+
+
+# Measures every case at every size, prints the table and optionally writes it as JSON
+def run_cases(cases, sizes, json_path=None):
+    results = [measure(name, size, run) for name, run in cases.items() for size in sizes]
+    print_report(results)
+    if json_path:
+        with open(json_path, "w", encoding="utf-8") as json_file:
+            json.dump(results, json_file, indent=2)
+    return results
@@ -0,0 +1,42 @@
+import argparse
+import json
+
+from benchmarks import (bench_evaluation, bench_imports, bench_indeed, bench_linkedin, bench_resume,
+                        bench_text_cleaning)
+
+# --------------------------------------------
+# Runs every offline benchmark in one go, e.g. before and after a performance change
+# Run from the project root: python -m benchmarks.run_all [--quick] [--json results.json]
+# Starts with the import-time report of the Streamlit app (see bench_imports)
+# --quick limits every suite to 10 and 100 jobs and measures imports once
+# --------------------------------------------
+SUITES = {
+    "indeed": bench_indeed,
+    "evaluation": bench_evaluation,
+    "linkedin": bench_linkedin,
+    "resume": bench_resume,
+}
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Run all JobHarvest benchmarks offline")
+    parser.add_argument("--quick", action="store_true", help="Only run 10 and 100 jobs per case")
+    parser.add_argument("--json", help="Write all results to this JSON file")
+    args = parser.parse_args(argv)
+
+    print("== startup imports ==")
+    results = {"imports": bench_imports.main(["--repeats", "1"] if args.quick else [])}
+    for name, suite in SUITES.items():
+        print(f"\n== {name} ==")
+        results[name] = suite.main(["--sizes", "10", "100"] if args.quick else [])
+
+    print("\n== text cleaning ==")
+    bench_text_cleaning.main()
+
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as json_file:
+            json.dump(results, json_file, indent=2)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,196 @@
+"""
+Headless batch runner for scheduled bulk harvesting.
+
+Runs the same scrape -> de-duplicate -> evaluate pipeline as the Streamlit app for every query in a
+queries file, without the UI:
+
+    python harvest.py --queries queries.csv --resume resume.pdf --output harvest_output
+
+The queries file (CSV, JSON or JSON Lines) has one row per search with the columns
+job_title, location and optionally num_jobs, remote_option, date_posted, job_type and platforms
+(platform names separated by ";"). Each finished query is checkpointed to <output>/queries/, so an
+interrupted run picks up where it stopped when started again with the same output directory.
+"""
+import argparse
+import hashlib
+import json
+import os
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+
+import pandas as pd
+
+from utilities.job_store import JOB_COLUMNS, get_default_store
+from utilities.metrics import METRICS
+from utilities.scrape_orchestrator import SCRAPERS, run_scrapers
+
+# Defaults for optional query columns (same choices as the Streamlit filters)
+QUERY_DEFAULTS = {
+    "num_jobs": 25,
+    "remote_option": "No",
+    "date_posted": "Any time",
+    "job_type": "Full-time",
+    "platforms": "",
+}
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="Scrape and evaluate many job searches without the Streamlit UI.")
+    parser.add_argument("--queries", required=True, help="CSV, JSON or JSON Lines file with one search per row")
+    parser.add_argument("--resume", help="Resume (PDF, DOCX or TXT) to evaluate the jobs against; omit to only scrape")
+    parser.add_argument("--output", default="harvest_output", help="Output and checkpoint directory")
+    parser.add_argument("--format", choices=["parquet", "csv"], default="parquet", help="Output file format")
+    parser.add_argument("--workers", type=int, default=2, help="Number of queries processed in parallel")
+    parser.add_argument("--platforms", default=",".join(SCRAPERS),
+                        help="Comma-separated platforms used when a query does not name its own")
+    parser.add_argument("--metrics", help="Write run metrics to this file (.prom for Prometheus text, else JSON)")
+    return parser.parse_args(argv)
+
+
+# --------------------------------------------
+# Loads the queries file into a list of dicts with every column filled in
+# --------------------------------------------
+def load_queries(path):
+    if path.endswith(".csv"):
+        queries_df = pd.read_csv(path, dtype=str)
+    else:
+        queries_df = pd.read_json(path, lines=path.endswith((".jsonl", ".ndjson")), dtype=False)
+
+    missing = {"job_title", "location"} - set(queries_df.columns)
+    if missing:
+        raise ValueError(f"Queries file is missing required columns: {', '.join(sorted(missing))}")
+
+    queries = []
+    for record in queries_df.to_dict("records"):
+        query = {**QUERY_DEFAULTS, **{key: value for key, value in record.items() if not pd.isna(value)}}
+        query["num_jobs"] = int(query["num_jobs"])
+        queries.append(query)
+    return queries
+
+
+# Stable ID of a query, used to name its checkpoint file
+def query_id(query):
+    payload = json.dumps({key: str(query[key]) for key in sorted(query)})
+    return hashlib.sha1(payload.encode("utf-8")).hexdigest()[:16]
+
+
+def write_frame(df, path, file_format):
+    if file_format == "parquet":
+        df.to_parquet(path, index=False)
+    else:
+        df.to_csv(path, index=False)
+
+
+def read_frame(path, file_format):
+    if file_format == "parquet":
+        return pd.read_parquet(path)
+    try:
+        return pd.read_csv(path)
+    except pd.errors.EmptyDataError:
+        # Header-less empty checkpoint written by older versions
+        return pd.DataFrame()
+
+
+# --------------------------------------------
+# Runs one query through the pipeline: scrape all its platforms in parallel,
+# de-duplicate against the job store and (if a resume is given) evaluate the jobs
+# Returns the resulting DataFrame tagged with the query's ID, title and location (with all columns even if empty)
+# Raises RuntimeError if any platform or job evaluation failed, so the query is not checkpointed and runs again
+# next time
+# --------------------------------------------
+def run_query(query, default_platforms, resume_text):
+    platforms = [platform.strip() for platform in str(query["platforms"]).split(";") if platform.strip()]
+    platforms = platforms or default_platforms
+
+    frames, errors = [], []
+    for platform, status, payload in run_scrapers(platforms, query["job_title"], query["location"],
+                                                  query["num_jobs"], query["remote_option"],
+                                                  query["date_posted"], query["job_type"]):
+        if status == "done":
+            frames.append(payload)
+        elif status == "failed":
+            errors.append(f"{platform}: {payload}")
+    if errors:
+        raise RuntimeError("; ".join(errors))
+
+    frames = [frame for frame in frames if not frame.empty]
+    jobs_df = pd.concat(frames, ignore_index=True) if frames else pd.DataFrame(columns=JOB_COLUMNS)
+    jobs_data = get_default_store().upsert(jobs_df)
+    if resume_text and not jobs_data.empty:
+        from utilities.gpt_parser import evaluate_job_matches
+
+        match_df = evaluate_job_matches(jobs_data, resume_text)
+        if match_df.attrs.get("failed_jobs"):
+            # Successful evaluations are cached, so the rerun only sends the failed jobs to the LLM again
+            raise RuntimeError(f"{match_df.attrs['failed_jobs']} of {len(match_df)} job evaluations failed")
+        # The evaluation returns one row per job in the same order, so the store columns are copied by position
+        jobs_data = match_df.assign(**{column: jobs_data[column].to_numpy()
+                                       for column in ("Status", "First Seen", "Last Seen")})
+
+    return jobs_data.assign(**{"Query ID": query_id(query), "Query Title": query["job_title"],
+                               "Query Location": query["location"]})
+
+
+def main(argv=None):
+    args = parse_args(argv)
+    queries = load_queries(args.queries)
+    default_platforms = [platform.strip() for platform in args.platforms.split(",") if platform.strip()]
+    resume_text = None
+    if args.resume:
+        from utilities.resume_reader import read_resume
+
+        # harvest.py only runs main() under its __main__ guard, so long PDFs may use worker processes
+        resume_text = read_resume(args.resume, parallel=True)
+        if not resume_text:
+            print(f"Unable to extract text from {args.resume}")
+            return 1
+
+    checkpoint_dir = os.path.join(args.output, "queries")
+    os.makedirs(checkpoint_dir, exist_ok=True)
+
+    def checkpoint_path(query):
+        return os.path.join(checkpoint_dir, f"{query_id(query)}.{args.format}")
+
+    # Skip queries that finished in an earlier run
+    pending = [query for query in queries if not os.path.exists(checkpoint_path(query))]
+    print(f"{len(queries)} queries, {len(queries) - len(pending)} already done, {len(pending)} to run")
+
+    failures = 0
+    started = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=max(1, args.workers)) as executor:
+        futures = {executor.submit(run_query, query, default_platforms, resume_text): query for query in pending}
+        for done, future in enumerate(as_completed(futures), start=1):
+            query = futures[future]
+            label = f"{query['job_title']} / {query['location']}"
+            try:
+                result = future.result()
+            except Exception as e:
+                failures += 1
+                print(f"[{done}/{len(pending)}] {label}: failed ({e})")
+                continue
+            # Write to a temporary file first so a crash never leaves a half-written checkpoint
+            temporary_path = checkpoint_path(query) + ".tmp"
+            write_frame(result, temporary_path, args.format)
+            os.replace(temporary_path, checkpoint_path(query))
+            print(f"[{done}/{len(pending)}] {label}: {len(result)} jobs")
+
+    # Combine every checkpoint of this queries file into one results file
+    frames = [read_frame(checkpoint_path(query), args.format) for query in queries
+              if os.path.exists(checkpoint_path(query))]
+    frames = [frame for frame in frames if not frame.empty]
+    if frames:
+        results_path = os.path.join(args.output, f"results.{args.format}")
+        write_frame(pd.concat(frames, ignore_index=True), results_path, args.format)
+        print(f"Wrote {sum(len(frame) for frame in frames)} rows to {results_path}")
+
+    if args.metrics:
+        with open(args.metrics, "w", encoding="utf-8") as metrics_file:
+            metrics_file.write(METRICS.to_prometheus() if args.metrics.endswith(".prom") else METRICS.to_json())
+
+    print(f"Finished in {time.perf_counter() - started:.1f}s with {failures} failed queries")
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
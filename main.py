@@ -1,10 +1,11 @@
 import pandas as pd
 import streamlit as st
-from pypdf import PdfReader
 
-from utilities.gpt_parser import evaluate_job_matches
-from utilities.indeed_scraper import scrape_indeed
-from utilities.linkedin_scraper import scrape_linkedin
+# Only lightweight modules are imported up front; Selenium, Apify, LangChain, FAISS and the OpenAI clients
+# are imported when scraping or evaluation starts (scrapers resolve lazily in the orchestrator)
+from utilities.job_store import get_default_store
+from utilities.metrics import METRICS
+from utilities.scrape_orchestrator import SCRAPERS, run_scrapers
 
 # --------------------------------------------
 # 🚀 Streamlit Page Configuration
@@ -28,7 +29,7 @@ with col2:
 
 with col3:
     st.subheader("Number of Jobs Per Website")
-    num_jobs = st.number_input("Enter a range (e.g., 5-10)", min_value=5, max_value=50, value=5, step=1)
+    num_jobs = st.number_input("Enter a range (e.g., 5-10)", min_value=5, max_value=500, value=5, step=1)
 
 # --------------------------------------------
 # 🧰 Additional Job Filters: Date Posted, Remote, Job Type
@@ -55,16 +56,21 @@ with col3:
 # 🌐 Job Platform Selection (checkbox options)
 # --------------------------------------------
 st.subheader("Select Job Platforms")
-col1, col2 = st.columns(2)
 
+# One checkbox per registered scraper (see utilities/scrape_orchestrator.py)
+platform_columns = st.columns(len(SCRAPERS))
 platforms_selected = {
-    "LinkedIn": col2.checkbox("LinkedIn", value=False),
-    "Indeed": col1.checkbox("Indeed", value=False),
-    # Future integrations can be added below:
-    # "Glassdoor": col3.checkbox("Glassdoor", value=False),
-    # "Zip Recruiter": col4.checkbox("Zip Recruiter", value=False),
+    platform: column.checkbox(platform, value=False)
+    for platform, column in zip(SCRAPERS, platform_columns)
 }
 
+
+# Job store (SQLite connection) shared by all sessions
+@st.cache_resource
+def load_job_store():
+    return get_default_store()
+
+
 # --------------------------------------------
 # 🚦 Scraping Button: Initiates the scraping process
 # --------------------------------------------
@@ -78,57 +84,127 @@ if st.button("Start Scraping"):
     else:
         st.success(f"Scraping Jobs from: {', '.join(selected_platforms)}")
 
+        # One status box per platform, updated as the parallel scrapers report back
+        platform_status = {
+            platform: st.status(f"{platform}: waiting to start", state="running")
+            for platform in selected_platforms
+        }
+
+        # Live table of the rows received so far (streaming scrapers fill it in as jobs arrive)
+        live_table = st.empty()
+        streamed_counts = {}
+
         all_jobs_data = []
-        for platform in selected_platforms:
-            st.write(f"Scraping from {platform} for '{job_title}' in '{location}'")
-            # Call appropriate scraper function based on selected platform
-            if platform == "LinkedIn":
-                jobs_data = scrape_linkedin(job_title, location, num_jobs, remote_option, date_posted, job_type)
-            elif platform == "Indeed":
-                jobs_data = scrape_indeed(job_title, location, num_jobs, remote_option, date_posted, job_type)
-
-            all_jobs_data.append(jobs_data)
-        # Combine all job data and save to session state
+        # Run all selected scrapers at the same time; results arrive as each platform finishes
+        for platform, status, payload in run_scrapers(selected_platforms, job_title, location, num_jobs,
+                                                      remote_option, date_posted, job_type):
+            if status == "started":
+                platform_status[platform].update(label=f"Scraping from {platform} for '{job_title}' in '{location}'")
+            elif status == "rows":
+                streamed_counts[platform] = streamed_counts.get(platform, 0) + len(payload)
+                platform_status[platform].update(label=f"{platform}: {streamed_counts[platform]} jobs so far")
+                all_jobs_data.append(payload)
+                live_table.dataframe(pd.concat(all_jobs_data, ignore_index=True))
+            elif status == "done":
+                platform_status[platform].update(label=f"{platform}: {len(payload)} jobs scraped", state="complete")
+                # Streamed platforms already added their rows chunk by chunk
+                if platform not in streamed_counts:
+                    all_jobs_data.append(payload)
+            else:
+                platform_status[platform].update(label=f"{platform}: scraping failed", state="error")
+                platform_status[platform].write(str(payload))
+        live_table.empty()
+
+        # Combine all job data, de-duplicate it against the persistent job store and save to session state
         if all_jobs_data:
-            jobs_data_combined = pd.concat(all_jobs_data, ignore_index=True)
+            jobs_data_combined = load_job_store().upsert(pd.concat(all_jobs_data, ignore_index=True))
             st.session_state.jobs_data = jobs_data_combined
 
+            status_counts = jobs_data_combined["Status"].value_counts()
+            st.info(f"{status_counts.get('new', 0)} new, {status_counts.get('changed', 0)} changed and "
+                    f"{status_counts.get('unchanged', 0)} previously seen listings "
+                    "(unchanged listings reuse cached evaluations)")
+
             # Display results before proceeding to resume evaluation
             st.subheader("🔍 Scraped Job Listings")
             st.dataframe(jobs_data_combined)  # Shows data in a scrollable table format
 
 
 # --------------------------------------------
-# 📄 PDF Reader Function to Extract Resume Text
+# 🧠 Resume index (chunks, embeddings, FAISS) built once per resume and kept across reruns
 # --------------------------------------------
-def read_pdf(file):
-    pdf_reader = PdfReader(file)
-    text = ""
-    for page in pdf_reader.pages:
-        text += page.extract_text() or ""
-    return text.strip()
+@st.cache_resource(show_spinner="Indexing resume...")
+def load_resume_index(resume_text):
+    from utilities.resume_index import get_resume_index
+    return get_resume_index(resume_text)
+
+
+# Connection-pooled chat model shared by all sessions
+@st.cache_resource(show_spinner="Loading the evaluation model...")
+def load_llm():
+    from utilities.gpt_parser import REQUEST_TIMEOUT
+    from utilities.resume_index import get_llm
+    return get_llm(REQUEST_TIMEOUT)
+
 
 # --------------------------------------------
 # 📈 Resume Analysis Section (After Jobs are Scraped)
 # --------------------------------------------
 if "jobs_data" in st.session_state:
+    from utilities.resume_reader import SUPPORTED_TYPES, read_resume
+
     st.subheader("Resume Analysis")
 
-    # File uploader for PDF resume
-    uploaded_file = st.file_uploader("Upload Resume (PDF only)", type=["pdf"])
+    # File uploader for the resume (PDF, DOCX or TXT)
+    uploaded_file = st.file_uploader("Upload Resume (PDF, DOCX or TXT)", type=list(SUPPORTED_TYPES))
 
     if uploaded_file is not None:
-        # Extract raw text from uploaded PDF resume
-        resume_text = read_pdf(uploaded_file)
+        # Extract raw text from the uploaded resume (cached by file hash, so reruns skip parsing)
+        resume_text = read_resume(uploaded_file.getvalue(), uploaded_file.name)
 
         if st.button("Evaluate Jobs"):
             if resume_text:
                 st.write("Evaluating your resume with different job listings...")
+                from utilities.gpt_parser import evaluate_job_matches
+
                 # Call GPT-based evaluation logic
-                match_df = evaluate_job_matches(st.session_state.jobs_data, resume_text)
+                match_df = evaluate_job_matches(st.session_state.jobs_data, resume_text, llm=load_llm(),
+                                                resume_index=load_resume_index(resume_text))
                 # Display the match results as a table
                 st.dataframe(match_df)
+
+                parse_stats = match_df.attrs.get("parse_stats", {})
+                if parse_stats.get("validated"):
+                    st.caption(f"Structured output: {parse_stats['failure_rate']:.1%} of answers failed validation, "
+                               f"{parse_stats['reasks']} re-asks, {parse_stats['unrecovered']} jobs unrecovered")
             else:
-                st.warning("Unable to extract text from the uploaded PDF.")
+                st.warning("Unable to extract text from the uploaded resume (scanned PDFs have no text layer).")
+    else:
+        st.info("Please upload a resume file in PDF, DOCX or TXT format.")
+
+
+# --------------------------------------------
+# 🩺 Diagnostics: latency, token, cost, error and cache metrics of this process (see utilities/metrics.py)
+# --------------------------------------------
+with st.expander("Diagnostics"):
+    metrics_snapshot = METRICS.snapshot()
+    if not metrics_snapshot["counters"] and not metrics_snapshot["histograms"]:
+        st.write("No metrics recorded yet.")
     else:
-        st.info("Please upload a resume file in PDF format.")
+        def metric_table(entries):
+            return pd.DataFrame([{"Metric": entry["name"],
+                                  "Labels": ", ".join(f"{key}={value}" for key, value in entry["labels"].items()),
+                                  **{key: value for key, value in entry.items() if key not in ("name", "labels")}}
+                                 for entry in entries])
+
+        st.markdown("**Latencies (seconds)**")
+        st.dataframe(metric_table(metrics_snapshot["histograms"]))
+        st.markdown("**Counters**")
+        st.dataframe(metric_table(metrics_snapshot["counters"]))
+
+        col1, col2, col3 = st.columns(3)
+        col1.download_button("Download JSON", METRICS.to_json(), file_name="jobharvest_metrics.json")
+        col2.download_button("Download Prometheus text", METRICS.to_prometheus(), file_name="jobharvest_metrics.prom")
+        if col3.button("Reset metrics"):
+            METRICS.reset()
+            st.rerun()
@@ -0,0 +1,22 @@
+from utilities.context_builder import compress_description, count_tokens
+
+
+def test_short_description_is_unchanged():
+    assert compress_description("Build APIs in Python.", max_tokens=50) == "Build APIs in Python."
+
+
+def test_unpunctuated_description_is_truncated_not_emptied():
+    description = " ".join(f"skill{i} experience with python and cloud" for i in range(700))
+    compressed = compress_description(description, max_tokens=600)
+    assert compressed
+    assert description.startswith(compressed)
+    assert count_tokens(compressed) <= 600
+
+
+def test_requirement_sentences_are_kept():
+    description = "We build payment systems. " + "Our office has great coffee. " * 300 + \
+                  "Requirements: 5+ years of Python."
+    compressed = compress_description(description, max_tokens=100)
+    assert compressed.startswith("We build payment systems.")
+    assert "Requirements: 5+ years of Python." in compressed
+    assert count_tokens(compressed) <= 100
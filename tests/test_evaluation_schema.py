@@ -0,0 +1,46 @@
+import threading
+
+import pytest
+
+pytest.importorskip("pydantic")
+
+from utilities.evaluation_schema import ParseStats, parse_batch_matches, parse_job_match  # noqa: E402
+from utilities.metrics import METRICS  # noqa: E402
+
+
+def counter(name, **labels):
+    return sum(entry["value"] for entry in METRICS.snapshot()["counters"]
+               if entry["name"] == name and entry["labels"] == labels)
+
+
+def test_parse_job_match_accepts_fenced_json_and_skill_lists():
+    match = parse_job_match('```json\n{"match_percentage": 80, "skill_gaps": ["Go", "K8s"], "suggestions": " x "}\n```')
+    assert (match.match_percentage, match.skill_gaps, match.suggestions) == (80, "Go, K8s", "x")
+
+
+def test_parse_batch_matches_counts_into_the_given_stats():
+    stats = ParseStats()
+    invalid_before = counter("llm_answers_validated_total", outcome="invalid")
+    answer = ('{"results": [{"job_index": 0, "match_percentage": 70, "skill_gaps": "", "suggestions": "ok"}, '
+              '{"job_index": 1, "match_percentage": 170, "skill_gaps": "", "suggestions": "ok"}]}')
+
+    assert list(parse_batch_matches(answer, 2, stats)) == [0]
+    assert stats.snapshot() == {"validated": 2, "invalid": 1, "reasks": 0, "unrecovered": 0, "failure_rate": 0.5}
+    assert counter("llm_answers_validated_total", outcome="invalid") == invalid_before + 1
+
+
+def test_overlapping_runs_keep_separate_stats():
+    good, bad = ParseStats(), ParseStats()
+
+    def record(stats, valid):
+        for _ in range(1000):
+            stats.record(valid=valid)
+
+    threads = [threading.Thread(target=record, args=(good, True)), threading.Thread(target=record, args=(bad, False))]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert good.snapshot()["failure_rate"] == 0.0
+    assert bad.snapshot()["failure_rate"] == 1.0
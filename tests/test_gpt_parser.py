@@ -0,0 +1,203 @@
+import json
+import threading
+import time
+import zlib
+from types import SimpleNamespace
+
+import pandas as pd
+import pytest
+
+pytest.importorskip("openai")
+pytest.importorskip("langchain_community")
+
+from benchmarks.fakes import StubEmbeddings, StubLLM  # noqa: E402
+from utilities import gpt_parser  # noqa: E402
+from utilities.gpt_parser import call_with_retry, evaluate_job_matches  # noqa: E402
+from utilities.metrics import METRICS  # noqa: E402
+
+RESUME_TEXT = "Senior Python engineer.\nBuilt REST APIs on AWS with PostgreSQL.\nSkills: Python, SQL, Docker."
+
+
+def make_jobs(size):
+    return pd.DataFrame({
+        "Platform": "LinkedIn",
+        "Job Title": [f"Engineer {i}" for i in range(size)],
+        "Company": [f"Company {i}" for i in range(size)],
+        "Location": "Remote",
+        "Job Description": [f"Build Python services for team {i}. Requirements: SQL, AWS." for i in range(size)],
+        "Job URL": [f"https://example.com/jobs/{i}" for i in range(size)],
+    })
+
+
+def evaluate(jobs_df, llm, **kwargs):
+    options = {"embeddings": StubEmbeddings(), "use_cache": False, "prerank_top_k": None, "batch_size": 1}
+    return evaluate_job_matches(jobs_df, RESUME_TEXT, llm=llm, **{**options, **kwargs})
+
+
+def counter(name, **labels):
+    return sum(entry["value"] for entry in METRICS.snapshot()["counters"]
+               if entry["name"] == name and entry["labels"] == labels)
+
+
+# Answers later jobs faster, so requests finish in a different order than they were sent
+class ShuffledLLM(StubLLM):
+    def invoke(self, prompt):
+        time.sleep(0.002 * (zlib.crc32(prompt.encode("utf-8")) % 10))
+        return super().invoke(prompt)
+
+
+# Raises `error` for prompts containing `marker`, the first `times` times (None = always)
+class FlakyLLM(StubLLM):
+    def __init__(self, marker, error, times=None):
+        super().__init__()
+        self.marker = marker
+        self.error = error
+        self.times = times
+        self.prompts = []
+        self._calls_lock = threading.Lock()
+
+    def invoke(self, prompt):
+        with self._calls_lock:
+            self.prompts.append(prompt)
+            fail = self.marker in prompt and (self.times is None or self.times > 0)
+            if fail and self.times is not None:
+                self.times -= 1
+        if fail:
+            raise self.error
+        return super().invoke(prompt)
+
+
+@pytest.fixture(autouse=True)
+def no_backoff(monkeypatch):
+    monkeypatch.setattr(gpt_parser, "RETRY_BACKOFF", 0.0)
+
+
+def test_results_keep_the_input_order_under_concurrency():
+    jobs_df = make_jobs(20)
+    match_df = evaluate(jobs_df, ShuffledLLM(), max_concurrency=8)
+
+    assert match_df["Job URL"].tolist() == jobs_df["Job URL"].tolist()
+    assert match_df["Match Percentage"].notna().all()
+    assert match_df.attrs["failed_jobs"] == 0
+
+
+def test_a_failing_job_does_not_abort_the_run():
+    llm = FlakyLLM("Job Title: Engineer 2\n", ValueError("model refused"))
+    match_df = evaluate(make_jobs(5), llm)
+
+    failed = match_df["Match Percentage"].isna()
+    assert failed.tolist() == [False, False, True, False, False]
+    assert match_df.loc[2, "Resume Tailoring Suggestions"].startswith("Evaluation failed")
+    assert match_df.attrs["failed_jobs"] == 1
+
+
+def test_retryable_errors_are_retried():
+    retries_before = counter("llm_retries_total", error="TimeoutError")
+    llm = FlakyLLM("Job Title: Engineer 1\n", TimeoutError("slow"), times=2)
+    match_df = evaluate(make_jobs(3), llm, max_retries=3)
+
+    assert match_df["Match Percentage"].notna().all()
+    assert counter("llm_retries_total", error="TimeoutError") == retries_before + 2
+
+
+def test_call_with_retry_backs_off_exponentially(monkeypatch):
+    delays = []
+    monkeypatch.setattr(gpt_parser, "RETRY_BACKOFF", 2.0)
+    monkeypatch.setattr(gpt_parser, "time", SimpleNamespace(sleep=delays.append))
+    attempts = []
+
+    def fn():
+        attempts.append(1)
+        raise TimeoutError("slow")
+
+    with pytest.raises(TimeoutError):
+        call_with_retry(fn, max_retries=3)
+    assert len(attempts) == 4
+    # 2s, 4s, 8s plus up to 50% jitter
+    assert [2 <= delays[0] <= 3, 4 <= delays[1] <= 6, 8 <= delays[2] <= 12] == [True] * 3
+
+
+def test_other_errors_are_not_retried():
+    attempts = []
+
+    def fn():
+        attempts.append(1)
+        raise ValueError("bad request")
+
+    with pytest.raises(ValueError):
+        call_with_retry(fn, max_retries=3)
+    assert len(attempts) == 1
+
+
+def test_batched_jobs_missing_from_the_answer_fall_back_to_single_calls():
+    class PartialBatchLLM(StubLLM):
+        def invoke(self, prompt):
+            response = super().invoke(prompt)
+            payload = json.loads(response.content)
+            if "results" in payload:
+                payload["results"] = [entry for entry in payload["results"] if entry["job_index"] != 1]
+            return SimpleNamespace(content=json.dumps(payload), usage_metadata=None)
+
+    match_df = evaluate(make_jobs(3), PartialBatchLLM(), batch_size=3)
+
+    assert match_df["Match Percentage"].notna().all()
+    assert match_df.attrs["parse_stats"]["validated"] == 3
+
+
+def test_failed_batch_request_falls_back_to_single_calls():
+    fallbacks_before = counter("llm_batch_fallbacks_total", error="ValueError")
+    llm = FlakyLLM("### Job 0", ValueError("context too long"))
+    match_df = evaluate(make_jobs(4), llm, batch_size=4)
+
+    assert match_df["Match Percentage"].notna().all()
+    assert counter("llm_batch_fallbacks_total", error="ValueError") == fallbacks_before + 1
+    assert sum("### Job" not in prompt for prompt in llm.prompts) == 4
+
+
+def test_prerank_sends_only_the_top_jobs_to_the_llm():
+    llm = FlakyLLM("never", ValueError())
+    match_df = evaluate(make_jobs(6), llm, prerank_top_k=2)
+
+    evaluated = match_df["Match Percentage"].notna()
+    assert evaluated.sum() == 2 and len(llm.prompts) == 2
+    # The evaluated jobs are the two most similar ones
+    assert set(match_df["Similarity Score"].nlargest(2).index) == set(match_df.index[evaluated])
+    assert (match_df.loc[~evaluated, "Resume Tailoring Suggestions"]
+            == "Not evaluated: below the similarity pre-ranking cutoff").all()
+
+
+def test_prerank_min_similarity_skips_every_job_below_it():
+    llm = FlakyLLM("never", ValueError())
+    match_df = evaluate(make_jobs(3), llm, prerank_min_similarity=1.1)
+
+    assert llm.prompts == []
+    assert match_df["Match Percentage"].isna().all()
+    assert len(match_df) == 3
+
+
+def test_overlapping_runs_report_their_own_parse_stats():
+    class InvalidLLM(StubLLM):
+        def invoke(self, prompt):
+            super().invoke(prompt)
+            return SimpleNamespace(content="not json", usage_metadata=None)
+
+    results = {}
+
+    def run(name, llm):
+        results[name] = evaluate(make_jobs(5), llm, max_concurrency=4).attrs["parse_stats"]
+
+    threads = [threading.Thread(target=run, args=("good", ShuffledLLM())),
+               threading.Thread(target=run, args=("bad", InvalidLLM()))]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert results["good"] == {"validated": 5, "invalid": 0, "reasks": 0, "unrecovered": 0, "failure_rate": 0.0}
+    # Every bad answer is re-asked once and stays invalid
+    assert results["bad"]["validated"] == 10 and results["bad"]["failure_rate"] == 1.0
+    assert results["bad"]["unrecovered"] == 5
+
+
+def test_empty_input_returns_an_empty_frame():
+    assert evaluate(make_jobs(0), StubLLM()).empty
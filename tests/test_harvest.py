@@ -0,0 +1,127 @@
+import functools
+
+import pandas as pd
+import pytest
+
+import harvest
+from utilities import job_store
+from utilities.job_store import JOB_COLUMNS, JobStore
+from utilities.scrape_orchestrator import SCRAPERS, STREAMERS, register_scraper
+
+
+def working_scraper(job_title, location, num_jobs, remote_option, date_posted, job_type):
+    return pd.DataFrame([{"Platform": "Working", "Job Title": job_title, "Company": "Acme", "Location": location,
+                          "Job Description": "Build APIs.", "Job URL": f"https://example.com/jobs/{job_title}"}],
+                        columns=JOB_COLUMNS)
+
+
+def empty_scraper(*args):
+    return pd.DataFrame(columns=JOB_COLUMNS)
+
+
+def failing_scraper(*args):
+    raise ConnectionError("site unreachable")
+
+
+# Indeed rows have a NaN URL when the actor omits job_url
+def no_url_scraper(job_title, *args):
+    return pd.DataFrame([{"Platform": "NoUrl", "Job Title": f"{job_title} {i}", "Company": f"Company {i}",
+                          "Location": "Remote", "Job Description": "Write Python services.", "Job URL": float("nan")}
+                         for i in range(3)], columns=JOB_COLUMNS)
+
+
+@pytest.fixture(autouse=True)
+def fake_platforms(monkeypatch):
+    monkeypatch.setattr(job_store, "_default_store", JobStore(":memory:"))
+    saved = dict(SCRAPERS), dict(STREAMERS)
+    SCRAPERS.clear()
+    STREAMERS.clear()
+    register_scraper("Working", working_scraper)
+    register_scraper("Empty", empty_scraper)
+    register_scraper("Failing", failing_scraper)
+    register_scraper("NoUrl", no_url_scraper)
+    yield
+    for registry, entries in zip((SCRAPERS, STREAMERS), saved):
+        registry.clear()
+        registry.update(entries)
+
+
+def write_queries(tmp_path, platforms):
+    path = tmp_path / "queries.csv"
+    pd.DataFrame({"job_title": ["Go Dev", "Python Dev"], "location": ["SF", "NYC"],
+                  "platforms": platforms}).to_csv(path, index=False)
+    return str(path)
+
+
+@pytest.mark.parametrize("file_format", ["csv", "parquet"])
+def test_failed_platforms_fail_the_query_and_are_not_checkpointed(tmp_path, file_format):
+    if file_format == "parquet":
+        pytest.importorskip("pyarrow")
+    queries = write_queries(tmp_path, ["Failing", "Working;Failing"])
+    output = tmp_path / "out"
+
+    for _ in range(2):
+        assert harvest.main(["--queries", queries, "--output", str(output), "--format", file_format]) == 1
+        assert list((output / "queries").iterdir()) == []
+
+
+def test_empty_results_keep_their_columns_and_combine(tmp_path):
+    queries = write_queries(tmp_path, ["Empty", "Working"])
+    output = tmp_path / "out"
+
+    assert harvest.main(["--queries", queries, "--output", str(output), "--format", "csv"]) == 0
+    assert len(list((output / "queries").iterdir())) == 2
+    # Rerun skips both queries and still combines their checkpoints
+    assert harvest.main(["--queries", queries, "--output", str(output), "--format", "csv"]) == 0
+
+    results = pd.read_csv(output / "results.csv")
+    assert results["Job Title"].tolist() == ["Python Dev"]
+    assert {"Status", "Query ID"} <= set(results.columns)
+
+
+
+# Real evaluation with the offline stub LLM and embeddings instead of the OpenAI clients
+def use_stub_evaluation(monkeypatch, llm):
+    gpt_parser = pytest.importorskip("utilities.gpt_parser")
+    fakes = pytest.importorskip("benchmarks.fakes")
+    monkeypatch.setattr(gpt_parser, "evaluate_job_matches",
+                        functools.partial(gpt_parser.evaluate_job_matches, llm=llm,
+                                          embeddings=fakes.StubEmbeddings(), use_cache=False))
+
+
+def write_resume(tmp_path):
+    path = tmp_path / "resume.txt"
+    path.write_text("Senior Python engineer.\nBuilt APIs on AWS.", encoding="utf-8")
+    return str(path)
+
+
+def test_evaluated_jobs_without_urls_are_not_duplicated(monkeypatch):
+    fakes = pytest.importorskip("benchmarks.fakes")
+    use_stub_evaluation(monkeypatch, fakes.StubLLM())
+    query = {**harvest.QUERY_DEFAULTS, "job_title": "Go Dev", "location": "SF", "platforms": "NoUrl"}
+
+    results = harvest.run_query(query, [], "Senior Python engineer.")
+
+    assert results["Job Title"].tolist() == ["Go Dev 0", "Go Dev 1", "Go Dev 2"]
+    assert results["Status"].tolist() == ["new"] * 3
+    assert results["Match Percentage"].notna().all()
+
+
+def test_failed_evaluations_are_not_checkpointed(tmp_path, monkeypatch):
+    fakes = pytest.importorskip("benchmarks.fakes")
+
+    class FailingLLM(fakes.StubLLM):
+        def invoke(self, prompt):
+            if "Job Title: Python Dev" in prompt:
+                raise ValueError("model refused")
+            return super().invoke(prompt)
+
+    use_stub_evaluation(monkeypatch, FailingLLM())
+    queries = write_queries(tmp_path, ["Working", "Working"])
+    output = tmp_path / "out"
+
+    assert harvest.main(["--queries", queries, "--resume", write_resume(tmp_path), "--output", str(output),
+                         "--format", "csv"]) == 1
+    # Only the query whose job evaluated is done
+    assert len(list((output / "queries").iterdir())) == 1
+    assert pd.read_csv(output / "results.csv")["Job Title"].tolist() == ["Go Dev"]
@@ -0,0 +1,28 @@
+import pytest
+
+pytest.importorskip("apify_client")
+
+from benchmarks.fakes import FakeApifyClient  # noqa: E402
+from utilities.indeed_scraper import scrape_indeed, stream_indeed  # noqa: E402
+
+SEARCH = ("Software Engineer", "New York", 10, "No", "Any time", "Full-time")
+
+
+def test_succeeded_run_returns_all_jobs():
+    jobs = scrape_indeed(*SEARCH, client=FakeApifyClient(10))
+    assert len(jobs) == 10
+
+
+@pytest.mark.parametrize("final_status", ["FAILED", "TIMED-OUT"])
+def test_failed_run_raises(final_status):
+    client = FakeApifyClient(3, final_status=final_status)
+    with pytest.raises(RuntimeError, match=final_status):
+        list(stream_indeed(*SEARCH, client=client, poll_interval=0.01))
+
+
+def test_closing_the_stream_early_aborts_the_run():
+    client = FakeApifyClient(10, items_per_second=20)
+    chunks = stream_indeed(*SEARCH, client=client, poll_interval=0.01)
+    next(chunks)
+    chunks.close()
+    assert client.aborted
@@ -0,0 +1,91 @@
+import pandas as pd
+import pytest
+
+from utilities.job_store import JobStore, fingerprint, normalize_url
+
+
+def make_jobs(*rows):
+    return pd.DataFrame([{
+        "Platform": platform,
+        "Job Title": title,
+        "Company": company,
+        "Location": location,
+        "Job Description": description,
+        "Job URL": url,
+    } for platform, title, company, location, description, url in rows])
+
+
+@pytest.fixture
+def store():
+    return JobStore(":memory:")
+
+
+@pytest.mark.parametrize("url, expected", [
+    ("https://www.linkedin.com/jobs/view/123456/?refId=abc&trk=xyz", "linkedin.com/jobs/view/123456"),
+    ("https://linkedin.com/jobs/view/senior-python-developer-at-acme-123456", "linkedin.com/jobs/view/123456"),
+    ("https://www.indeed.com/viewjob?jk=abc123&from=serp", "indeed.com/viewjob?jk=abc123"),
+    ("https://Careers.Example.com/jobs/42/?utm_source=x#apply", "careers.example.com/jobs/42"),
+    ("", ""),
+    (None, ""),
+])
+def test_normalize_url(url, expected):
+    assert normalize_url(url) == expected
+
+
+def test_fingerprint_ignores_formatting_differences():
+    assert (fingerprint("Senior Python Developer", "Acme, Inc.", "New York, NY (Hybrid)")
+            == fingerprint("python developer senior", "ACME", "New York, United States"))
+
+
+def test_fingerprint_separates_different_jobs():
+    assert fingerprint("Python Developer", "Acme", "New York") != fingerprint("Python Developer", "Acme", "Boston")
+    assert fingerprint("Python Developer", "Acme", "New York") != fingerprint("Go Developer", "Acme", "New York")
+
+
+def test_upsert_marks_new_unchanged_and_changed(store):
+    job = ("LinkedIn", "Python Developer", "Acme", "New York, NY", "Build APIs.",
+           "https://www.linkedin.com/jobs/view/111/")
+    assert store.upsert(make_jobs(job))["Status"].tolist() == ["new"]
+    assert store.upsert(make_jobs(job))["Status"].tolist() == ["unchanged"]
+
+    changed = job[:4] + ("Build APIs and pipelines.",) + job[5:]
+    assert store.upsert(make_jobs(changed))["Status"].tolist() == ["changed"]
+    assert store.count() == 1
+
+
+def test_upsert_keeps_same_title_postings_with_different_urls(store):
+    jobs = make_jobs(
+        ("LinkedIn", "Python Developer", "Acme", "New York, NY", "Payments team.",
+         "https://www.linkedin.com/jobs/view/111"),
+        ("LinkedIn", "Python Developer", "Acme", "New York, NY", "Search team.",
+         "https://www.linkedin.com/jobs/view/222"),
+    )
+    for _ in range(2):
+        result = store.upsert(jobs)
+        assert result["Job URL"].tolist() == jobs["Job URL"].tolist()
+    assert result["Status"].tolist() == ["unchanged", "unchanged"]
+    assert store.count() == 2
+
+
+def test_upsert_merges_same_posting_across_platforms(store):
+    linkedin = ("LinkedIn", "Python Developer", "Acme Inc", "New York, NY", "Build APIs.",
+                "https://www.linkedin.com/jobs/view/111")
+    indeed = ("Indeed", "Python Developer", "Acme", "New York", "Build APIs.",
+              "https://www.indeed.com/viewjob?jk=abc")
+
+    result = store.upsert(make_jobs(linkedin, indeed))
+    assert result["Platform"].tolist() == ["LinkedIn"]
+    assert store.count() == 1
+
+    # Both URLs are aliases of the stored job, so each platform alone is matched by URL later on
+    assert store.upsert(make_jobs(indeed))["Status"].tolist() == ["changed"]
+    assert store.upsert(make_jobs(linkedin))["Status"].tolist() == ["changed"]
+    assert store.count() == 1
+
+
+def test_upsert_matches_rows_without_url_by_fingerprint(store):
+    store.upsert(make_jobs(("Indeed", "Python Developer", "Acme", "New York", "Build APIs.",
+                            "https://www.indeed.com/viewjob?jk=abc")))
+    result = store.upsert(make_jobs(("Indeed", "Python Developer", "Acme", "New York", "Build APIs.", "")))
+    assert result["Status"].tolist() == ["unchanged"]
+    assert store.count() == 1
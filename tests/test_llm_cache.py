@@ -0,0 +1,65 @@
+import json
+
+import pytest
+
+from utilities.llm_cache import CachedEmbeddings, LLMCache
+
+
+class CountingEmbeddings:
+    model = "counting"
+
+    def __init__(self):
+        self.calls = 0
+
+    def embed_documents(self, texts):
+        self.calls += 1
+        return [[float(len(text)), 0.5] for text in texts]
+
+    def embed_query(self, text):
+        self.calls += 1
+        return [float(len(text)), 0.5]
+
+
+@pytest.fixture
+def cache():
+    return LLMCache(":memory:", max_entries=3)
+
+
+def test_round_trip_and_hit_counters(cache):
+    cache.set("llm_results", "a", {"match_percentage": 80})
+    assert cache.get("llm_results", "a") == {"match_percentage": 80}
+    assert cache.get("llm_results", "missing") is None
+    assert (cache.hits, cache.misses) == (1, 1)
+
+
+def test_vectors_are_stored_as_float32_blobs(cache):
+    cache.set("embeddings", "v", [0.25, -1.5])
+    stored = cache._conn.execute("SELECT value FROM embeddings WHERE key = 'v'").fetchone()[0]
+    assert isinstance(stored, bytes) and len(stored) == 8
+    assert cache.get("embeddings", "v") == [0.25, -1.5]
+
+
+def test_json_vectors_from_older_caches_are_still_read(cache):
+    with cache._conn:
+        cache._conn.execute("INSERT INTO embeddings VALUES ('old', ?, strftime('%s'), strftime('%s'))",
+                            (json.dumps([1.0, 2.0]),))
+    assert cache.get("embeddings", "old") == [1.0, 2.0]
+
+
+def test_least_recently_used_entries_are_evicted_past_the_cap(cache):
+    for key in "abc":
+        cache.set("llm_results", key, key)
+    cache.get("llm_results", "a")
+    cache.set("llm_results", "d", "d")
+    assert cache.stats()["llm_results"] == 2
+    assert cache.get("llm_results", "b") is None
+    assert cache.get("llm_results", "a") == "a"
+
+
+def test_cached_embeddings_only_embed_new_texts(cache):
+    underlying = CountingEmbeddings()
+    embeddings = CachedEmbeddings(underlying, cache)
+    first = embeddings.embed_documents(["ab", "cde"])
+    assert embeddings.embed_documents(["ab", "cde"]) == first
+    assert embeddings.embed_query("ab") == first[0]
+    assert underlying.calls == 1
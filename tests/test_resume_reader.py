@@ -0,0 +1,26 @@
+import pytest
+
+pytest.importorskip("pypdf")
+
+from benchmarks.bench_resume import LINE, LINES_PER_PAGE, make_pdf  # noqa: E402
+from utilities import resume_reader  # noqa: E402
+from utilities.resume_reader import read_resume  # noqa: E402
+
+
+def test_pdf_is_extracted_in_process_by_default(monkeypatch):
+    def no_pool(*args, **kwargs):
+        raise AssertionError("process pool started")
+
+    monkeypatch.setattr(resume_reader, "ProcessPoolExecutor", no_pool)
+    monkeypatch.setattr(resume_reader, "MAX_WORKERS", 4)
+    text = read_resume(make_pdf(resume_reader.PARALLEL_MIN_PAGES), "resume.pdf")
+    assert text.count(LINE) == resume_reader.PARALLEL_MIN_PAGES * LINES_PER_PAGE
+
+
+def test_txt_falls_back_to_cp1252():
+    assert read_resume("Caf\xe9 owner".encode("cp1252"), "resume.txt") == "Caf\xe9 owner"
+
+
+def test_unsupported_type_is_rejected():
+    with pytest.raises(ValueError):
+        read_resume(b"", "resume.rtf")
@@ -0,0 +1,15 @@
+import pandas as pd
+
+from utilities.text_cleaning import clean_job_description, normalize_descriptions
+
+
+def test_clean_job_description_strips_markup_and_decodes_entities():
+    text = "<p>Python&nbsp;&amp; SQL</p>\n<script>track()</script><!-- pixel -->\n\n<b>Remote</b>"
+    assert clean_job_description(text) == "Python & SQL Remote"
+
+
+def test_normalize_descriptions_matches_scalar_cleaner():
+    descriptions = pd.Series(["<li>Go</li>\t<li>AWS</li>", None, "Plain text"], index=[3, 4, 5])
+    cleaned = normalize_descriptions(descriptions)
+    assert cleaned.tolist() == ["Go AWS", "", "Plain text"]
+    assert cleaned.index.tolist() == [3, 4, 5]
@@ -1,17 +1,29 @@
+import atexit
 import os
+import queue
+import threading
 
 from selenium import webdriver
 from selenium.webdriver.chrome.service import Service
 
+from utilities.metrics import METRICS
 
-def launch_driver():
-    # Get the absolute path to the ChromeDriver executable located in the "Resources" folder
-    chrome_driver_path = os.path.abspath("Resources/chromedriver.exe")
+# --------------------------------------------
+# Driver pool settings
+# - POOL_SIZE: max number of Chrome sessions kept alive at once
+# - MAX_USES: a session is recycled after this many checkouts
+# - MAX_JS_HEAP_MB: a session is recycled once the JS heap of its current page grows beyond this size
+#   (what WebDriver can report; the browser's process memory is not visible without extra dependencies,
+#   so MAX_USES is what bounds slower growth such as caches and other tabs' renderers)
+# - CHECKOUT_TIMEOUT: seconds to wait for a free session before giving up
+# --------------------------------------------
+POOL_SIZE = 2
+MAX_USES = 20
+MAX_JS_HEAP_MB = 512
+CHECKOUT_TIMEOUT = 300
 
-    # Raise an error if the ChromeDriver path isn't found (basic check)
-    if chrome_driver_path is None:
-        raise Exception("ChromeDriver not found. Ensure it is installed and added to PATH.")
 
+def build_options():
     # Create an instance of ChromeOptions to customize browser behavior
     options = webdriver.ChromeOptions()
     # Launch the browser in maximized window mode
@@ -21,12 +33,153 @@ def launch_driver():
     # Enable headless mode (browser runs in background without UI)
     options.add_argument("--headless=new")
 
-    # Optional (Recommended) – Avoid loading images to speed up scraping
     options.add_argument("--disable-gpu")
     options.add_argument("--no-sandbox")
     options.add_argument("--disable-dev-shm-usage")
 
+    # Avoid loading images and web fonts to cut page-load bytes (scraping only needs the DOM text)
+    options.add_argument("--blink-settings=imagesEnabled=false")
+    options.add_argument("--disable-remote-fonts")
+    options.add_experimental_option("prefs", {"profile.managed_default_content_settings.images": 2})
+    return options
+
+
+def launch_driver():
+    # Get the absolute path to the ChromeDriver executable located in the "Resources" folder
+    chrome_driver_path = os.path.abspath("Resources/chromedriver.exe")
+
+    # Raise an error if the ChromeDriver path isn't found (basic check)
+    if chrome_driver_path is None:
+        raise Exception("ChromeDriver not found. Ensure it is installed and added to PATH.")
+
     service = Service(chrome_driver_path)
-    driver = webdriver.Chrome(service=service, options=options)
+    with METRICS.timer("driver_launch_seconds"):
+        driver = webdriver.Chrome(service=service, options=build_options())
 
     return driver
+
+
+# --------------------------------------------
+# Pool of warm, reusable Chrome sessions
+# - warmup(driver) runs once per new session (e.g. loading login cookies)
+# - sessions are health-checked on checkout and recycled after max_uses or when the page's JS heap grows too large
+# - checkout blocks while all `size` sessions are in use, so concurrent searches share the pool safely
+# Usage (checkin must always follow checkout, including when the scrape fails or its generator is closed):
+#     driver = pool.checkout()
+#     try:
+#         driver.get(...)
+#     finally:
+#         pool.checkin(driver, healthy=pool.is_healthy(driver))
+# --------------------------------------------
+class DriverPool:
+    def __init__(self, size=POOL_SIZE, warmup=None, max_uses=MAX_USES, max_js_heap_mb=MAX_JS_HEAP_MB,
+                 factory=launch_driver):
+        self.size = size
+        self.warmup = warmup
+        self.max_uses = max_uses
+        self.max_js_heap_mb = max_js_heap_mb
+        self.factory = factory
+        self._idle = queue.LifoQueue()
+        self._uses = {}
+        self._lock = threading.Lock()
+        self._slots = threading.BoundedSemaphore(size)
+
+    def checkout(self, timeout=CHECKOUT_TIMEOUT):
+        with METRICS.timer("driver_checkout_wait_seconds"):
+            if not self._slots.acquire(timeout=timeout):
+                raise TimeoutError(f"No Chrome session became available within {timeout} seconds.")
+        try:
+            # Reuse the most recently returned healthy session, discarding dead ones
+            while True:
+                try:
+                    driver = self._idle.get_nowait()
+                except queue.Empty:
+                    return self._create()
+                if self.is_healthy(driver):
+                    METRICS.inc("driver_sessions_total", event="reused")
+                    return driver
+                self._discard(driver)
+        except Exception:
+            self._slots.release()
+            raise
+
+    def checkin(self, driver, healthy=True):
+        try:
+            with self._lock:
+                self._uses[driver] = self._uses.get(driver, 0) + 1
+                uses = self._uses[driver]
+            if not healthy or uses >= self.max_uses or self.js_heap_mb(driver) > self.max_js_heap_mb:
+                self._discard(driver)
+            else:
+                self._idle.put(driver)
+        finally:
+            self._slots.release()
+
+    def close(self):
+        while True:
+            try:
+                driver = self._idle.get_nowait()
+            except queue.Empty:
+                break
+            self._discard(driver)
+
+    def _create(self):
+        driver = self.factory()
+        try:
+            if self.warmup is not None:
+                self.warmup(driver)
+        except Exception:
+            driver.quit()
+            raise
+        with self._lock:
+            self._uses[driver] = 0
+        METRICS.inc("driver_sessions_total", event="created")
+        return driver
+
+    def _discard(self, driver):
+        with self._lock:
+            self._uses.pop(driver, None)
+        METRICS.inc("driver_sessions_total", event="discarded")
+        try:
+            driver.quit()
+        except Exception as e:
+            print(f"Failed to quit Chrome session: {e}")
+
+    @staticmethod
+    def is_healthy(driver):
+        try:
+            driver.execute_script("return document.readyState")
+            return True
+        except Exception:
+            return False
+
+    # JS heap used by the session's current page in MB (0 if the browser does not report it);
+    # not the memory of the Chrome processes
+    @staticmethod
+    def js_heap_mb(driver):
+        try:
+            used = driver.execute_script("return window.performance.memory ? performance.memory.usedJSHeapSize : 0")
+            return (used or 0) / (1024 * 1024)
+        except Exception:
+            return 0
+
+
+_pools = {}
+_pools_lock = threading.Lock()
+
+
+# --------------------------------------------
+# Returns the process-wide pool registered under `name`, creating it on first use
+# --------------------------------------------
+def get_driver_pool(name, warmup=None, size=POOL_SIZE):
+    with _pools_lock:
+        if name not in _pools:
+            _pools[name] = DriverPool(size=size, warmup=warmup)
+        return _pools[name]
+
+
+@atexit.register
+def close_driver_pools():
+    with _pools_lock:
+        for pool in _pools.values():
+            pool.close()
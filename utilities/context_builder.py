@@ -0,0 +1,121 @@
+import re
+
+import tiktoken
+
+# --------------------------------------------
+# Prompt token budgets
+# - MAX_DESCRIPTION_TOKENS: longer job descriptions are compressed to their requirement/skills content
+# - RESUME_TOKEN_BUDGET: max tokens of resume chunks put into one prompt
+# - CANDIDATE_CHUNKS: resume chunks retrieved per job before the budget is applied
+# --------------------------------------------
+MAX_DESCRIPTION_TOKENS = 600
+RESUME_TOKEN_BUDGET = 1200
+CANDIDATE_CHUNKS = 8
+
+# Headings that start the part of a posting the evaluation cares about
+SECTION_PATTERN = re.compile(
+    r"\b(requirements?|qualifications?|skills|what you(?:'ll| will) (?:need|bring)|who you are|"
+    r"must[- ]haves?|nice[- ]to[- ]haves?|preferred|experience with|you have)\b",
+    re.IGNORECASE
+)
+# Sentences that state a requirement even outside such a section
+REQUIREMENT_PATTERN = re.compile(
+    r"\b(\d+\+? years?|experience|proficien\w*|knowledge of|familiar\w*|degree|certif\w*|"
+    r"required|must|expert\w*|skills?)\b",
+    re.IGNORECASE
+)
+SENTENCE_SPLIT_PATTERN = re.compile(r"(?<=[.!?;:•])\s+|\s+(?=[•·▪-]\s)")
+
+# Lazily loaded tiktoken encoding (False when unavailable)
+_encoding = None
+
+
+# --------------------------------------------
+# Counts tokens the way GPT-4o does; falls back to a chars/4 estimate if tiktoken has no encoding available
+# --------------------------------------------
+def count_tokens(text):
+    global _encoding
+    if _encoding is None:
+        try:
+            _encoding = tiktoken.encoding_for_model("gpt-4o")
+        except Exception:
+            _encoding = False
+    if _encoding is False:
+        return len(text) // 4 + 1
+    return len(_encoding.encode(text, disallowed_special=()))
+
+
+# Cuts text down to its first max_tokens tokens
+def truncate_tokens(text, max_tokens):
+    count_tokens("")  # loads the encoding
+    if _encoding is False:
+        return text[:max(0, max_tokens - 1) * 4]
+    return _encoding.decode(_encoding.encode(text, disallowed_special=())[:max_tokens])
+
+
+# --------------------------------------------
+# Shrinks a job description to at most max_tokens tokens
+# - short descriptions are returned unchanged
+# - otherwise keeps the opening sentence (role summary), then sentences from requirement/skills
+#   sections, then other requirement-like sentences, in that priority, and joins them in original order
+# - an opening sentence longer than the whole budget (e.g. a bullet list flattened without punctuation)
+#   is truncated instead of dropped, so the result is never empty
+# --------------------------------------------
+def compress_description(description, max_tokens=MAX_DESCRIPTION_TOKENS):
+    description = str(description)
+    if count_tokens(description) <= max_tokens:
+        return description
+
+    sentences = [sentence for sentence in SENTENCE_SPLIT_PATTERN.split(description) if sentence.strip()]
+    section_start = next((i for i, sentence in enumerate(sentences) if SECTION_PATTERN.search(sentence)),
+                         len(sentences))
+
+    in_section = list(range(section_start, len(sentences)))
+    requirement_like = [i for i in range(section_start) if i > 0 and REQUIREMENT_PATTERN.search(sentences[i])]
+    priority = [0] + in_section + requirement_like
+
+    if count_tokens(sentences[0]) >= max_tokens:
+        sentences[0] = truncate_tokens(sentences[0], max_tokens - 1)
+
+    # The opening sentence always fits now, so it is always kept
+    kept, used = {0}, count_tokens(sentences[0]) + 1
+    for i in priority[1:]:
+        tokens = count_tokens(sentences[i]) + 1
+        if used + tokens > max_tokens:
+            continue
+        kept.add(i)
+        used += tokens
+    return " ".join(sentences[i] for i in sorted(kept))
+
+
+# --------------------------------------------
+# Picks the most relevant resume chunks for a query without exceeding token_budget
+# Candidates come from the FAISS store best first; a chunk that does not fit is skipped
+# so smaller, less relevant chunks can still use the remaining budget
+# Returns a list of chunk texts
+# --------------------------------------------
+def select_resume_chunks(docsearch, query, token_budget=RESUME_TOKEN_BUDGET, candidates=CANDIDATE_CHUNKS):
+    return fill_budget([[doc.page_content for doc in docsearch.similarity_search(query, k=candidates)]],
+                       token_budget)
+
+
+# --------------------------------------------
+# Shared chunk selection for a batch of jobs
+# Takes the best remaining chunk of each job in turn (round-robin) so every job gets relevant context
+# --------------------------------------------
+def select_batch_resume_chunks(docsearch, queries, token_budget=RESUME_TOKEN_BUDGET, candidates=CANDIDATE_CHUNKS):
+    ranked = [[doc.page_content for doc in docsearch.similarity_search(query, k=candidates)] for query in queries]
+    return fill_budget(ranked, token_budget)
+
+
+def fill_budget(ranked_lists, token_budget):
+    selected, used = [], 0
+    for rank in range(max((len(ranked) for ranked in ranked_lists), default=0)):
+        for ranked in ranked_lists:
+            if rank >= len(ranked) or ranked[rank] in selected:
+                continue
+            tokens = count_tokens(ranked[rank])
+            if used + tokens <= token_budget:
+                selected.append(ranked[rank])
+                used += tokens
+    return selected
@@ -0,0 +1,133 @@
+import json
+import re
+import threading
+
+from pydantic import BaseModel, Field, field_validator
+
+from utilities.metrics import METRICS
+
+# Format description embedded in the evaluation prompts
+JOB_MATCH_FORMAT = (
+    '{"match_percentage": <number between 0-100>, '
+    '"skill_gaps": "<comma-separated list of missing or weak skills>", '
+    '"suggestions": "<brief but detailed recommendation on how to tailor the resume for this job>"}'
+)
+
+
+# --------------------------------------------
+# Schema of one job evaluation returned by the LLM
+# --------------------------------------------
+class JobMatch(BaseModel):
+    match_percentage: float = Field(ge=0, le=100)
+    skill_gaps: str
+    suggestions: str = Field(min_length=1)
+
+    # Models sometimes answer with a list of skills instead of a comma-separated string
+    @field_validator("skill_gaps", mode="before")
+    @classmethod
+    def join_skill_list(cls, value):
+        if isinstance(value, list):
+            return ", ".join(str(skill).strip() for skill in value)
+        return value
+
+    @field_validator("skill_gaps", "suggestions")
+    @classmethod
+    def strip_text(cls, value):
+        return value.strip()
+
+
+# One entry of a batched evaluation
+class BatchJobMatch(JobMatch):
+    job_index: int = Field(ge=0)
+
+
+# Models sometimes wrap JSON in a markdown code fence
+def strip_code_fence(response_text):
+    return re.sub(r"^```(?:json)?\s*|\s*```$", "", response_text.strip())
+
+
+# --------------------------------------------
+# Validates a single-job answer against JobMatch
+# Raises ValueError (pydantic ValidationError or JSON decode error) when it does not fit the schema
+# --------------------------------------------
+def parse_job_match(response_text):
+    return JobMatch.model_validate_json(strip_code_fence(response_text))
+
+
+# --------------------------------------------
+# Validates the entries of a batched answer ({"results": [...]}) one by one
+# Returns {job_index: JobMatch} for the valid entries only; raises ValueError if the answer is not a results object
+# Validation outcomes are counted in `stats` (a ParseStats of the current run)
+# --------------------------------------------
+def parse_batch_matches(response_text, num_jobs, stats=None):
+    stats = stats if stats is not None else ParseStats()
+    payload = json.loads(strip_code_fence(response_text))
+    if not isinstance(payload, dict) or not isinstance(payload.get("results"), list):
+        raise ValueError("Batched answer has no 'results' list")
+
+    parsed = {}
+    for entry in payload["results"]:
+        try:
+            match = BatchJobMatch.model_validate(entry)
+        except ValueError:
+            stats.record(valid=False)
+            continue
+        if match.job_index < num_jobs:
+            stats.record(valid=True)
+            parsed[match.job_index] = match
+    return parsed
+
+
+# Targeted re-ask: only the invalid answer and the validation error are sent back
+def build_repair_prompt(response_text, error):
+    return (
+        "The following answer does not match the required JSON format.\n\n"
+        f"Answer:\n{response_text}\n\n"
+        f"Validation error:\n{error}\n\n"
+        f"Respond with the corrected JSON only, in this exact format:\n{JOB_MATCH_FORMAT}"
+    )
+
+
+# --------------------------------------------
+# Thread-safe counters of how often LLM answers fail schema validation, one instance per evaluation run
+# - validated / invalid: answers checked and answers rejected
+# - reasks: repair requests sent
+# - unrecovered: jobs still invalid after their re-asks
+# Every count is also added to the process-wide METRICS counters (llm_answers_validated_total,
+# llm_reasks_total, llm_unrecovered_jobs_total)
+# --------------------------------------------
+class ParseStats:
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.validated = 0
+        self.invalid = 0
+        self.reasks = 0
+        self.unrecovered = 0
+
+    def record(self, valid):
+        with self._lock:
+            self.validated += 1
+            if not valid:
+                self.invalid += 1
+        METRICS.inc("llm_answers_validated_total", outcome="valid" if valid else "invalid")
+
+    def record_reask(self):
+        with self._lock:
+            self.reasks += 1
+        METRICS.inc("llm_reasks_total")
+
+    def record_unrecovered(self):
+        with self._lock:
+            self.unrecovered += 1
+        METRICS.inc("llm_unrecovered_jobs_total")
+
+    def snapshot(self):
+        with self._lock:
+            return {
+                "validated": self.validated,
+                "invalid": self.invalid,
+                "reasks": self.reasks,
+                "unrecovered": self.unrecovered,
+                "failure_rate": self.invalid / self.validated if self.validated else 0.0,
+            }
+
@@ -1,111 +1,400 @@
-import os
-import re
+import random
+import time
+from concurrent.futures import ThreadPoolExecutor
 
+import numpy as np
 import pandas as pd
-from langchain.chains.question_answering import load_qa_chain
-from langchain.text_splitter import CharacterTextSplitter
-from langchain_community.vectorstores import FAISS
-from langchain_openai import OpenAIEmbeddings, ChatOpenAI
+from openai import APIConnectionError, APITimeoutError, RateLimitError
 
-# Load your OpenAI API key from environment variables
-openai_api_key = os.getenv("OPENAI_API_KEY")
+from utilities.context_builder import (compress_description, count_tokens, select_batch_resume_chunks,
+                                      select_resume_chunks)
+from utilities.evaluation_schema import (JOB_MATCH_FORMAT, ParseStats, build_repair_prompt, parse_batch_matches,
+                                         parse_job_match)
+from utilities.llm_cache import CachedEmbeddings, get_default_cache, make_key
+from utilities.metrics import METRICS, record_token_usage
+from utilities.resume_index import ResumeIndex, get_llm, get_resume_index
 
+# --------------------------------------------
+# Evaluation engine settings
+# - MAX_CONCURRENCY: number of jobs evaluated in parallel
+# - REQUEST_TIMEOUT: seconds before a single LLM request is abandoned
+# - MAX_RETRIES: retries per job on rate-limit/timeout errors
+# - RETRY_BACKOFF: base delay (seconds) for exponential backoff between retries
+# --------------------------------------------
+MAX_CONCURRENCY = 8
+REQUEST_TIMEOUT = 60
+MAX_RETRIES = 3
+RETRY_BACKOFF = 2.0
 
-def evaluate_job_matches(jobs_df, resume_text):
+# --------------------------------------------
+# Batch mode settings
+# - BATCH_SIZE: max number of jobs packed into one LLM request (1 disables batching)
+# - BATCH_TOKEN_BUDGET: max combined tokens of the job contexts in one batched request
+# --------------------------------------------
+BATCH_SIZE = 5
+BATCH_TOKEN_BUDGET = 12000
+
+# --------------------------------------------
+# Embedding pre-ranking settings
+# - PRERANK_TOP_K: only the K jobs most similar to the resume are sent to the LLM (None = no cap)
+# - PRERANK_MIN_SIMILARITY: jobs below this cosine similarity are never sent to the LLM (None = no cutoff)
+# --------------------------------------------
+PRERANK_TOP_K = 25
+PRERANK_MIN_SIMILARITY = None
+
+# Bump whenever the evaluation prompt or parsing changes so stale cached results are not reused
+PROMPT_VERSION = "3"
+
+# Number of targeted re-asks for an answer that fails schema validation
+MAX_REASKS = 1
+
+# Errors that are worth retrying; anything else fails the job immediately
+RETRYABLE_ERRORS = (RateLimitError, APITimeoutError, APIConnectionError, TimeoutError)
+
+
+def evaluate_job_matches(jobs_df, resume_text, max_concurrency=MAX_CONCURRENCY, request_timeout=REQUEST_TIMEOUT,
+                         max_retries=MAX_RETRIES, llm=None, embeddings=None, cache=None, use_cache=True,
+                         batch_size=BATCH_SIZE, batch_token_budget=BATCH_TOKEN_BUDGET,
+                         prerank_top_k=PRERANK_TOP_K, prerank_min_similarity=PRERANK_MIN_SIMILARITY,
+                         resume_index=None):
     """
         Evaluates how well a given resume matches each job listing in a DataFrame using OpenAI embeddings and GPT-4o.
-        Returns a new DataFrame with match percentage, skill gaps, and resume tailoring suggestions.
+        Returns a new DataFrame with match percentage, skill gaps, resume tailoring suggestions and similarity score,
+        one row per job in input order; the run's parse_stats and failed_jobs count are in its attrs.
         """
-    # -------------------------------
-    # STEP 1: Split the resume into overlapping text chunks for better vector representation
-    # -------------------------------
-    text_splitter = CharacterTextSplitter(
-        separator="\n",
-        chunk_size=1500,
-        chunk_overlap=200,
-        length_function=len
-    )
-    resume_chunks = text_splitter.split_text(resume_text)
-
-    # -------------------------------
-    # STEP 2: Embed the resume chunks into a FAISS vector store using OpenAI embeddings
-    # -------------------------------
-    embeddings = OpenAIEmbeddings(api_key=openai_api_key)
-    docsearch = FAISS.from_texts(resume_chunks, embeddings)
+    if use_cache and cache is None:
+        cache = get_default_cache()
+    if llm is None:
+        llm = get_llm(request_timeout)
+    model_name = getattr(llm, "model_name", None) or type(llm).__name__
+    parse_stats = ParseStats()
+    prerank = prerank_top_k is not None or prerank_min_similarity is not None
 
     # -------------------------------
-    # STEP 3: Load the LLM (ChatOpenAI using GPT-4o) and QA chain
+    # STEP 1: Look up jobs that were already evaluated against this resume
     # -------------------------------
-    llm = ChatOpenAI(model="gpt-4o", api_key=openai_api_key)
-    chain = load_qa_chain(llm, chain_type="stuff")
+    with METRICS.timer("evaluation_stage_seconds", stage="cache_lookup"):
+        rows = [row for _, row in jobs_df.iterrows()]
+        job_contexts = [build_job_context(row) for row in rows]
+        keys = [make_key(resume_text, job_context, model_name, PROMPT_VERSION) for job_context in job_contexts]
+        cached = cache.get_many("llm_results", keys) if use_cache else {}
+        pending = [i for i, key in enumerate(keys) if key not in cached]
+    METRICS.inc("evaluated_jobs_total", len(rows) - len(pending), outcome="cached")
 
-    results = []
-
-    # -------------------------------
-    # STEP 4: Iterate over each job listing in the DataFrame
-    # -------------------------------
-    for _, row in jobs_df.iterrows():
-        # Create a textual context using job metadata and description
-        job_context = (
-            f"Platform: {row['Platform']}\n"
-            f"Job Title: {row['Job Title']}\n"
-            f"Company: {row['Company']}\n"
-            f"Location: {row['Location']}\n"
-            f"Job Description: {row['Job Description']}\n"
-            f"Job URL: {row['Job URL']}\n"
-        )
+    results = [None] * len(rows)
+    failed_jobs = 0
+    for i, key in enumerate(keys):
+        if key in cached:
+            value = cached[key]
+            results[i] = build_result_row(rows[i], value["match_percentage"], value["skill_gaps"],
+                                          value["suggestions"])
 
+    similarity = None
+    if (pending or prerank) and resume_index is None:
         # -------------------------------
-        # STEP 5: Perform vector similarity search against the resume chunks
+        # STEP 2-3: Get the resume's chunks and FAISS vector store (built and embedded only once per resume)
+        # - injected embeddings get a fresh index so fakes never mix with the shared one
         # -------------------------------
-        docs = docsearch.similarity_search(job_context)
+        with METRICS.timer("evaluation_stage_seconds", stage="resume_index"):
+            if embeddings is None:
+                resume_index = get_resume_index(resume_text, use_cache=use_cache)
+            else:
+                if use_cache:
+                    embeddings = CachedEmbeddings(embeddings, cache)
+                resume_index = ResumeIndex.build(resume_text, embeddings)
 
+    if prerank:
         # -------------------------------
-        # STEP 6: Ask the LLM to evaluate the match between resume and job
+        # STEP 4: Pre-rank all jobs by embedding similarity; only the selected jobs go to the LLM
         # -------------------------------
-        prompt_query = (
-            "Evaluate the relevance of the provided resume (in chunks) to the following job description.\n\n"
-            "Return the following outputs strictly in this order:\n"
-            "1. **Match Percentage** (only a number between 0-100, no extra text).\n"
-            "2. **Skill Gaps** (a comma-separated list of missing or weak skills).\n"
-            "3. **Resume Tailoring Suggestions** (a brief but detailed recommendation on how to tailor the resume for this job).\n\n"
-            f"{job_context}"
-        )
-
-        response = chain.invoke({
-            "input_documents": docs,
-            "question": prompt_query
-        })
+        with METRICS.timer("evaluation_stage_seconds", stage="prerank"):
+            similarity = score_job_similarity(resume_index.embeddings, resume_index.chunk_vectors, rows)
+            selected = set(select_top_jobs(similarity, prerank_top_k, prerank_min_similarity))
+        for i in pending:
+            if i not in selected:
+                results[i] = build_result_row(rows[i], float("nan"), "",
+                                              "Not evaluated: below the similarity pre-ranking cutoff")
+        METRICS.inc("evaluated_jobs_total", sum(i not in selected for i in pending), outcome="skipped")
+        pending = [i for i in pending if i in selected]
 
+    if pending:
         # -------------------------------
-        # STEP 7: Extract structured data (match %, skill gaps, suggestions) from LLM output
+        # STEP 5: Evaluate the remaining job listings concurrently
+        # - Pending jobs are packed into batches (single-job batches use the per-job prompt)
+        # - Client-side retries are disabled so that retry/backoff is handled per request
+        # - executor.map keeps results in the same order as the pending jobs
         # -------------------------------
-        response_text = response["output_text"].strip()
-
-        # Use regex to extract structured data from LLM response
-        match = re.search(r"1\.\s*([\d.]+)", response_text)
-        skills = re.search(r"2\.\s*(.*)", response_text)
-        suggestions = re.search(r"3\.\s*(.*)", response_text)
-
-        match_percentage = float(match.group(1)) if match else 0.0
-        missing_skills = skills.group(1).strip() if skills else "Could not extract skills"
-        tailoring_suggestions = suggestions.group(1).strip() if suggestions else "Could not extract suggestions"
-
-        # Store results for each job
-        results.append({
-            "Platform": row["Platform"],
-            "Job Title": row["Job Title"],
-            "Company": row["Company"],
-            "Location": row["Location"],
-            "Job Description": row["Job Description"],
-            "Job URL": row["Job URL"],
-            "Match Percentage": match_percentage,
-            "Skill Gaps": missing_skills,
-            "Resume Tailoring Suggestions": tailoring_suggestions
-        })
+        batches = pack_batches(pending, job_contexts, batch_size, batch_token_budget)
+        with ThreadPoolExecutor(max_workers=max(1, max_concurrency)) as executor:
+            with METRICS.timer("evaluation_stage_seconds", stage="llm"):
+                evaluated_batches = list(executor.map(
+                    lambda batch: evaluate_job_batch(llm, resume_index.docsearch, [rows[i] for i in batch],
+                                                     [job_contexts[i] for i in batch], max_retries, parse_stats),
+                    batches
+                ))
+        evaluated = [item for batch_results in evaluated_batches for item in batch_results]
+        pending = [i for batch in batches for i in batch]
+
+        new_entries = {}
+        for i, (result, ok) in zip(pending, evaluated):
+            results[i] = result
+            METRICS.inc("evaluated_jobs_total", outcome="ok" if ok else "failed")
+            failed_jobs += not ok
+            # Failed evaluations are not cached so they are retried on the next run
+            if ok:
+                new_entries[keys[i]] = {
+                    "match_percentage": result["Match Percentage"],
+                    "skill_gaps": result["Skill Gaps"],
+                    "suggestions": result["Resume Tailoring Suggestions"],
+                }
+        if use_cache:
+            cache.set_many("llm_results", new_entries)
 
     # -------------------------------
-    # STEP 8: Convert all evaluation results into a DataFrame
+    # STEP 9: Convert all evaluation results into a DataFrame
     # -------------------------------
     match_df = pd.DataFrame(results)
+    if similarity is not None:
+        match_df["Similarity Score"] = similarity.round(4)
+    match_df.attrs["parse_stats"] = parse_stats.snapshot()
+    match_df.attrs["failed_jobs"] = failed_jobs
     return match_df
+
+
+# --------------------------------------------
+# Scores every job against the resume with one batched embedding call
+# - A job's score is its best cosine similarity to any resume chunk
+# Returns a NumPy array aligned with rows
+# --------------------------------------------
+def score_job_similarity(embeddings, chunk_vectors, rows):
+    if not rows:
+        return np.zeros(0)
+    job_texts = [f"{row['Job Title']}\n{compress_description(row['Job Description'])}" for row in rows]
+    job_matrix = np.asarray(embeddings.embed_documents(job_texts), dtype=np.float32)
+    chunk_matrix = np.asarray(chunk_vectors, dtype=np.float32)
+
+    job_matrix /= np.linalg.norm(job_matrix, axis=1, keepdims=True).clip(min=1e-12)
+    chunk_matrix /= np.linalg.norm(chunk_matrix, axis=1, keepdims=True).clip(min=1e-12)
+    return (job_matrix @ chunk_matrix.T).max(axis=1)
+
+
+# --------------------------------------------
+# Returns the indices of jobs to send to the LLM, best first:
+# jobs at or above min_similarity (if set), capped to the top_k highest scores (if set)
+# --------------------------------------------
+def select_top_jobs(similarity, top_k=PRERANK_TOP_K, min_similarity=PRERANK_MIN_SIMILARITY):
+    order = np.argsort(-similarity, kind="stable")
+    if min_similarity is not None:
+        order = order[similarity[order] >= min_similarity]
+    if top_k is not None:
+        order = order[:top_k]
+    return order.tolist()
+
+
+# --------------------------------------------
+# Evaluates one job listing against the resume vector store
+# Never raises: a job that cannot be evaluated is returned with an empty match percentage
+# and the error recorded in the suggestions column
+# Returns (result_row, ok)
+# --------------------------------------------
+def evaluate_single_job(llm, docsearch, row, max_retries=MAX_RETRIES, job_context=None, stats=None):
+    # Create a textual context using job metadata and description
+    if job_context is None:
+        job_context = build_job_context(row)
+
+    try:
+        response_text, prompt_tokens = invoke_with_retry(llm, docsearch, job_context, max_retries)
+
+        # -------------------------------
+        # STEP 8: Validate the structured answer (match %, skill gaps, suggestions), re-asking only if it is invalid
+        # -------------------------------
+        job_match, repair_tokens = validate_with_reask(llm, response_text, max_retries, stats)
+    except Exception as e:
+        print(f"Skipping job evaluation due to error: {e}")
+        return build_result_row(row, float("nan"), "Could not evaluate job", f"Evaluation failed: {e}"), False
+
+    return build_result_row(row, job_match.match_percentage, job_match.skill_gaps, job_match.suggestions,
+                            prompt_tokens + repair_tokens), True
+
+
+# --------------------------------------------
+# Validates an answer against the JobMatch schema
+# An invalid answer is sent back with its validation error (without the resume or job) up to MAX_REASKS times
+# Each answer checked and re-ask sent is counted in the run's `stats`
+# Returns (job_match, repair_prompt_tokens); raises ValueError if it is still invalid afterwards
+# --------------------------------------------
+def validate_with_reask(llm, response_text, max_retries=MAX_RETRIES, stats=None):
+    stats = stats if stats is not None else ParseStats()
+    attempt = 0
+    repair_tokens = 0
+    while True:
+        try:
+            job_match = parse_job_match(response_text)
+            stats.record(valid=True)
+            return job_match, repair_tokens
+        except ValueError as e:
+            stats.record(valid=False)
+            if attempt >= MAX_REASKS:
+                stats.record_unrecovered()
+                raise
+            stats.record_reask()
+            repair_prompt = build_repair_prompt(response_text, e)
+            repair_tokens += count_tokens(repair_prompt)
+            response_text = call_with_retry(lambda: invoke_llm(llm, repair_prompt), max_retries)
+            attempt += 1
+
+
+# --------------------------------------------
+# Builds the textual job context that is embedded and sent to the LLM
+# Long descriptions are compressed to their requirement/skills content
+# --------------------------------------------
+def build_job_context(row):
+    return (
+        f"Platform: {row['Platform']}\n"
+        f"Job Title: {row['Job Title']}\n"
+        f"Company: {row['Company']}\n"
+        f"Location: {row['Location']}\n"
+        f"Job Description: {compress_description(row['Job Description'])}\n"
+        f"Job URL: {row['Job URL']}\n"
+    )
+
+
+# --------------------------------------------
+# Runs the similarity search and LLM call for one job context
+# Returns (response_text, prompt_tokens)
+# --------------------------------------------
+def invoke_with_retry(llm, docsearch, job_context, max_retries=MAX_RETRIES):
+    # -------------------------------
+    # STEP 6: Pick the most relevant resume chunks that fit the resume token budget
+    # -------------------------------
+    resume_chunks = select_resume_chunks(docsearch, job_context)
+    prompt = build_prompt_query(resume_chunks, job_context)
+
+    # -------------------------------
+    # STEP 7: Ask the LLM to evaluate the match between resume and job
+    # -------------------------------
+    return call_with_retry(lambda: invoke_llm(llm, prompt), max_retries), count_tokens(prompt)
+
+
+# --------------------------------------------
+# Sends a prompt and returns the answer text (chat models return a message, plain LLMs a string)
+# Records the request latency and its tokens (reported usage if available, otherwise counted locally)
+# --------------------------------------------
+def invoke_llm(llm, prompt):
+    model_name = getattr(llm, "model_name", None) or type(llm).__name__
+    with METRICS.timer("llm_request_seconds", model=model_name):
+        response = llm.invoke(prompt)
+    text = getattr(response, "content", response).strip()
+
+    usage = getattr(response, "usage_metadata", None) or {}
+    record_token_usage(model_name, usage.get("input_tokens") or count_tokens(prompt),
+                       usage.get("output_tokens") or count_tokens(text))
+    return text
+
+
+# --------------------------------------------
+# Calls fn(), retrying rate-limit, timeout and connection errors with exponential backoff plus jitter
+# --------------------------------------------
+def call_with_retry(fn, max_retries=MAX_RETRIES):
+    attempt = 0
+    while True:
+        try:
+            return fn()
+        except RETRYABLE_ERRORS as e:
+            if attempt >= max_retries:
+                raise
+            METRICS.inc("llm_retries_total", error=type(e).__name__)
+            delay = RETRY_BACKOFF * (2 ** attempt)
+            time.sleep(delay + random.uniform(0, delay / 2))
+            attempt += 1
+
+
+def build_prompt_query(resume_chunks, job_context):
+    resume_text = "\n\n".join(resume_chunks)
+    return (
+        "Evaluate the relevance of the provided resume (in chunks) to the following job description.\n\n"
+        f"Respond with JSON only, in this exact format:\n{JOB_MATCH_FORMAT}\n\n"
+        f"Resume:\n{resume_text}\n\n"
+        f"Job:\n{job_context}"
+    )
+
+
+# --------------------------------------------
+# Groups job indices into batches of at most batch_size jobs whose contexts fit in token_budget
+# A job that exceeds the budget on its own gets a batch to itself
+# --------------------------------------------
+def pack_batches(indices, job_contexts, batch_size=BATCH_SIZE, token_budget=BATCH_TOKEN_BUDGET):
+    batches = []
+    current, current_tokens = [], 0
+    for i in indices:
+        tokens = count_tokens(job_contexts[i])
+        if current and (len(current) >= batch_size or current_tokens + tokens > token_budget):
+            batches.append(current)
+            current, current_tokens = [], 0
+        current.append(i)
+        current_tokens += tokens
+    if current:
+        batches.append(current)
+    return batches
+
+
+# --------------------------------------------
+# Evaluates a batch of jobs with a single LLM request
+# Jobs that are missing or malformed in the batched answer (or a failed batch request) fall back to per-job calls
+# Returns a list of (result_row, ok) aligned with rows
+# --------------------------------------------
+def evaluate_job_batch(llm, docsearch, rows, job_contexts, max_retries=MAX_RETRIES, stats=None):
+    if len(rows) == 1:
+        return [evaluate_single_job(llm, docsearch, rows[0], max_retries, job_contexts[0], stats)]
+
+    try:
+        prompt = build_batch_prompt(select_batch_resume_chunks(docsearch, job_contexts), job_contexts)
+        response_text = call_with_retry(lambda: invoke_llm(llm, prompt), max_retries)
+        parsed = parse_batch_matches(response_text, len(rows), stats)
+        # The batched prompt's tokens are shared equally by its jobs
+        prompt_tokens = round(count_tokens(prompt) / len(rows))
+    except Exception as e:
+        METRICS.inc("llm_batch_fallbacks_total", error=type(e).__name__)
+        print(f"Batch evaluation failed, falling back to per-job calls: {e}")
+        parsed = {}
+
+    results = []
+    for j, row in enumerate(rows):
+        if j in parsed:
+            job_match = parsed[j]
+            results.append((build_result_row(row, job_match.match_percentage, job_match.skill_gaps,
+                                             job_match.suggestions, prompt_tokens), True))
+        else:
+            results.append(evaluate_single_job(llm, docsearch, row, max_retries, job_contexts[j], stats))
+    return results
+
+
+def build_batch_prompt(resume_chunks, job_contexts):
+    resume_text = "\n\n".join(resume_chunks)
+    jobs_text = "\n".join(f"### Job {j}\n{job_context}" for j, job_context in enumerate(job_contexts))
+    return (
+        "Evaluate the relevance of the provided resume (in chunks) to each of the following job descriptions.\n\n"
+        "Respond with JSON only, in this exact format:\n"
+        '{"results": [{"job_index": <job number>, "match_percentage": <number between 0-100>, '
+        '"skill_gaps": "<comma-separated list of missing or weak skills>", '
+        '"suggestions": "<brief but detailed recommendation on how to tailor the resume for this job>"}]}\n'
+        f"Include exactly one entry for each job index from 0 to {len(job_contexts) - 1}.\n\n"
+        f"Resume:\n{resume_text}\n\n"
+        f"Jobs:\n{jobs_text}"
+    )
+
+
+# Store results for each job
+def build_result_row(row, match_percentage, missing_skills, tailoring_suggestions, prompt_tokens=0):
+    return {
+        "Platform": row["Platform"],
+        "Job Title": row["Job Title"],
+        "Company": row["Company"],
+        "Location": row["Location"],
+        "Job Description": row["Job Description"],
+        "Job URL": row["Job URL"],
+        "Match Percentage": match_percentage,
+        "Skill Gaps": missing_skills,
+        "Resume Tailoring Suggestions": tailoring_suggestions,
+        "Prompt Tokens": prompt_tokens
+    }
@@ -1,22 +1,39 @@
 import configparser
 import os
-import re
+import time
 
 import pandas as pd
 from apify_client import ApifyClient
 
+from utilities.metrics import METRICS
+from utilities.text_cleaning import normalize_descriptions
+# Re-exported for callers that clean single descriptions
+from utilities.text_cleaning import clean_job_description  # noqa: F401
+
+ACTOR_ID = "canadesk/indeed-linkedin"
 
 # --------------------------------------------
-# Function to clean job descriptions:
-# - Removes HTML tags
-# - Collapses multiple spaces and newlines
+# Actor polling settings
+# - POLL_INTERVAL: seconds between dataset polls while the actor runs
+# - CHUNK_SIZE: max items fetched (and yielded) per dataset request
+# - RUN_DEADLINE: seconds before the run is aborted and partial results are returned
 # --------------------------------------------
-def clean_job_description(text):
-    # Remove HTML tags
-    text = re.sub(r"<.*?>", " ", text)
-    # Replace multiple spaces/newlines with a single space
-    text = re.sub(r"\s+", " ", text).strip()
-    return text
+POLL_INTERVAL = 2.0
+CHUNK_SIZE = 25
+RUN_DEADLINE = 300
+
+TERMINAL_STATUSES = {"SUCCEEDED", "FAILED", "ABORTED", "TIMED-OUT"}
+# Terminal statuses of runs that did not finish on their own (runs aborted by us end the loop first)
+FAILED_STATUSES = {"FAILED", "ABORTED", "TIMED-OUT"}
+
+# Actor output column -> standard column name
+COLUMN_MAPPING = {
+    'title': 'Job Title',
+    'company': 'Company',
+    'location': 'Location',
+    'description': 'Job Description',
+    'job_url': 'Job URL'
+}
 
 
 # --------------------------------------------
@@ -28,23 +45,109 @@ def clean_job_description(text):
 # - remote_option: Whether to include remote jobs
 # - date_posted: Filter based on date
 # - job_type: Full-time, Part-time, etc.
+# - client: optional Apify client (defaults to one built from config.ini)
+# - deadline: seconds after which the actor run is aborted and the jobs found so far are returned
+# --------------------------------------------
+def scrape_indeed(job_title, location, num_jobs, remote_option, date_posted, job_type, client=None,
+                  deadline=RUN_DEADLINE):
+    chunks = list(stream_indeed(job_title, location, num_jobs, remote_option, date_posted, job_type,
+                                client=client, deadline=deadline))
+    if not chunks:
+        return pd.DataFrame(columns=list(COLUMN_MAPPING.values()) + ['Platform'])
+    return pd.concat(chunks, ignore_index=True)
+
+
+# --------------------------------------------
+# Streaming variant of scrape_indeed
+# Starts the Apify actor without waiting for it, polls its dataset while it runs and
+# yields cleaned DataFrame chunks as items land
+# Raises RuntimeError (after yielding the items it produced) if the run failed, timed out or was aborted elsewhere;
+# the run is aborted if the generator is closed before the run finished
+# The run's duration, time to first item and outcome are recorded in utilities.metrics
 # --------------------------------------------
-def scrape_indeed(job_title, location, num_jobs, remote_option, date_posted, job_type):
+def stream_indeed(job_title, location, num_jobs, remote_option, date_posted, job_type, client=None,
+                  poll_interval=POLL_INTERVAL, deadline=RUN_DEADLINE):
     # --------------------------------------------
-    # STEP 1: Load API Key from config.ini
+    # STEP 1-2: Initialize Apify client with the API key from config.ini
     # --------------------------------------------
-    config = configparser.ConfigParser()
-    config_file_path = os.path.abspath("Resources/config.ini")
-    config.read(config_file_path)
-    apify_api_key = config["DEFAULT"]["APIFY_API_KEY"]
+    if client is None:
+        client = ApifyClient(load_api_key())
+
     # --------------------------------------------
-    # STEP 2: Initialize Apify client with API key
+    # STEP 3-4: Prepare input for Apify actor run
     # --------------------------------------------
-    client = ApifyClient(apify_api_key)
+    run_input = build_run_input(job_title, location, num_jobs, remote_option, date_posted, job_type)
 
     # --------------------------------------------
-    # STEP 3: Define input mappings for API filters
+    # STEP 5: Start the actor (non-blocking) and poll its dataset while it runs
     # --------------------------------------------
+    with METRICS.timer("apify_start_seconds"):
+        run = client.actor(ACTOR_ID).start(run_input=run_input)
+    run_client = client.run(run["id"])
+    dataset_client = client.dataset(run["defaultDatasetId"])
+
+    started = time.monotonic()
+    offset = 0
+    status = None
+    outcome = "interrupted"
+    try:
+        while offset < num_jobs:
+            # Read the status before the items, so items written before the run finished are never missed
+            status = (run_client.get() or {}).get("status")
+
+            # Drain everything that has landed since the last poll
+            while offset < num_jobs:
+                with METRICS.timer("apify_list_items_seconds"):
+                    page = dataset_client.list_items(offset=offset, limit=min(CHUNK_SIZE, num_jobs - offset),
+                                                     clean=True)
+                if not page.items:
+                    break
+                if offset == 0:
+                    METRICS.observe("apify_first_item_seconds", time.monotonic() - started)
+                offset += len(page.items)
+                # --------------------------------------------
+                # STEP 6-7: Clean and format each chunk as it arrives
+                # --------------------------------------------
+                yield format_jobs(pd.DataFrame(page.items))
+
+            if status in TERMINAL_STATUSES:
+                outcome = status
+                if status in FAILED_STATUSES:
+                    raise RuntimeError(f"Apify run {run['id']} ended with status {status} after {offset} jobs")
+                break
+            if time.monotonic() - started > deadline:
+                outcome = "DEADLINE"
+                print(f"Indeed scrape hit the {deadline}s deadline; returning {offset} jobs found so far")
+                run_client.abort()
+                break
+            time.sleep(poll_interval)
+        else:
+            outcome = "ENOUGH_JOBS"
+            # Enough jobs collected; stop the actor instead of letting it run on
+            if status not in TERMINAL_STATUSES:
+                run_client.abort()
+    finally:
+        if outcome == "interrupted" and status not in TERMINAL_STATUSES:
+            # Closed early by the consumer or stopped by an error; don't leave the actor running
+            try:
+                run_client.abort()
+            except Exception as e:
+                print(f"Could not abort Apify run {run['id']}: {e}")
+        METRICS.observe("apify_run_seconds", time.monotonic() - started, outcome=outcome)
+
+
+def load_api_key():
+    # Load API Key from config.ini
+    config = configparser.ConfigParser()
+    config_file_path = os.path.abspath("Resources/config.ini")
+    config.read(config_file_path)
+    return config["DEFAULT"]["APIFY_API_KEY"]
+
+
+# --------------------------------------------
+# Maps the UI filters to the input of the "canadesk/indeed-linkedin" actor
+# --------------------------------------------
+def build_run_input(job_title, location, num_jobs, remote_option, date_posted, job_type):
     job_type_mapping = {
         "Full-time": "fulltime",
         "Part-time": "parttime",
@@ -59,12 +162,7 @@ def scrape_indeed(job_title, location, num_jobs, remote_option, date_posted, job
         "Past month": "72h",
     }
 
-    # --------------------------------------------
-    # STEP 4: Prepare input for Apify actor run
-    # - Uses "canadesk/indeed-linkedin" actor
-    # --------------------------------------------
-    # Prepare the Actor input
-    run_input = {
+    return {
         "city": location,
         "country": "USA",
         "title": job_title,
@@ -79,35 +177,15 @@ def scrape_indeed(job_title, location, num_jobs, remote_option, date_posted, job
         }
     }
 
-    # --------------------------------------------
-    # STEP 5: Run the actor and fetch results
-    # --------------------------------------------
-    run = client.actor("canadesk/indeed-linkedin").call(run_input=run_input)
-
-    data = [item for item in client.dataset(run["defaultDatasetId"]).iterate_items()]
-    df = pd.DataFrame(data)
-
-    # --------------------------------------------
-    # STEP 6: Clean and format the data
-    # - Select relevant columns
-    # - Rename them to standard format
-    # - Clean job descriptions
-    # --------------------------------------------
-    jobs_data = df[['title', 'company', 'location', 'description', 'job_url']].rename(
-        columns={
-            'title': 'Job Title',
-            'company': 'Company',
-            'location': 'Location',
-            'description': 'Job Description',
-            'job_url': 'Job URL'
-        }
-    )
 
+# --------------------------------------------
+# Clean and format a chunk of actor results
+# - Select relevant columns
+# - Rename them to standard format
+# - Clean job descriptions (vectorized over the whole chunk)
+# --------------------------------------------
+def format_jobs(df):
+    jobs_data = df.reindex(columns=list(COLUMN_MAPPING)).rename(columns=COLUMN_MAPPING)
     jobs_data['Platform'] = 'Indeed'
-
-    # --------------------------------------------
-    # STEP 7: Return the final cleaned DataFrame
-    # --------------------------------------------
-    jobs_data['Job Description'] = jobs_data['Job Description'].apply(clean_job_description)
-
+    jobs_data['Job Description'] = normalize_descriptions(jobs_data['Job Description'])
     return jobs_data
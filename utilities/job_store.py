@@ -0,0 +1,204 @@
+import hashlib
+import os
+import re
+import sqlite3
+import threading
+import time
+from urllib.parse import parse_qs, urlsplit
+
+import pandas as pd
+
+# --------------------------------------------
+# Job store settings
+# - STORE_PATH: SQLite file holding every job seen across runs and platforms
+# --------------------------------------------
+STORE_PATH = os.path.abspath("Resources/job_store.sqlite")
+
+JOB_COLUMNS = ['Platform', 'Job Title', 'Company', 'Location', 'Job Description', 'Job URL']
+
+# Words that do not help tell two postings apart
+COMPANY_SUFFIXES = {"inc", "llc", "ltd", "corp", "corporation", "co", "company", "plc", "gmbh", "the"}
+LOCATION_NOISE = {"remote", "hybrid", "onsite", "on", "site", "usa", "us", "united", "states"}
+
+
+# --------------------------------------------
+# Normalizes a job URL so the same posting always maps to the same string
+# - LinkedIn URLs are reduced to /jobs/view/<id>, Indeed URLs to their jk=<id> parameter
+# - otherwise scheme, query string, fragment and trailing slash are dropped
+# --------------------------------------------
+def normalize_url(url):
+    if not isinstance(url, str) or not url.strip():
+        return ""
+    parts = urlsplit(url.strip())
+    host = parts.netloc.lower().removeprefix("www.")
+    path = parts.path.rstrip("/")
+
+    linkedin_id = re.search(r"/jobs/view/(?:[^/]*?-)?(\d+)", path)
+    if "linkedin." in host and linkedin_id:
+        return f"linkedin.com/jobs/view/{linkedin_id.group(1)}"
+
+    indeed_id = parse_qs(parts.query).get("jk")
+    if "indeed." in host and indeed_id:
+        return f"indeed.com/viewjob?jk={indeed_id[0]}"
+
+    return f"{host}{path}"
+
+
+def _tokens(text, stop_words=()):
+    words = re.findall(r"[a-z0-9]+", str(text).lower())
+    return [word for word in words if word not in stop_words]
+
+
+# --------------------------------------------
+# Fuzzy fingerprint of a posting from title, company and city
+# Word order, punctuation, case, company suffixes and remote/hybrid markers are ignored,
+# so the same job listed on LinkedIn and Indeed gets the same fingerprint
+# --------------------------------------------
+def fingerprint(title, company, location):
+    title_key = " ".join(sorted(set(_tokens(title))))
+    company_key = " ".join(_tokens(company, COMPANY_SUFFIXES))
+    # Only the city is compared; state/country formats differ between platforms
+    city = str(location).split(",")[0]
+    location_key = " ".join(_tokens(city, LOCATION_NOISE))
+    return hashlib.sha1(f"{title_key}|{company_key}|{location_key}".encode("utf-8")).hexdigest()
+
+
+# Hash of the posting content; a different hash for a known job means the listing changed
+def content_hash(row):
+    description = re.sub(r"\s+", " ", str(row["Job Description"])).strip()
+    payload = "|".join([str(row["Job Title"]), str(row["Company"]), str(row["Location"]), description])
+    return hashlib.sha1(payload.encode("utf-8")).hexdigest()
+
+
+# --------------------------------------------
+# Persistent SQLite store of scraped jobs
+# Jobs are matched by normalized URL first; the fuzzy fingerprint is only used for rows without a URL
+# or to find the same posting on another site (a job never has two URLs on the same host).
+# Every URL a job was seen under is kept in job_urls, so later runs match it by URL again.
+# Jobs keep first-seen / last-seen timestamps across runs
+# --------------------------------------------
+class JobStore:
+    def __init__(self, path=STORE_PATH):
+        self.path = path
+        self._lock = threading.Lock()
+
+        if path != ":memory:":
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        with self._conn:
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS jobs ("
+                "job_id INTEGER PRIMARY KEY AUTOINCREMENT, url TEXT, fingerprint TEXT NOT NULL, "
+                "platform TEXT, title TEXT, company TEXT, location TEXT, description TEXT, job_url TEXT, "
+                "content_hash TEXT NOT NULL, first_seen REAL NOT NULL, last_seen REAL NOT NULL)"
+            )
+            self._conn.execute("CREATE INDEX IF NOT EXISTS jobs_url ON jobs (url)")
+            self._conn.execute("CREATE INDEX IF NOT EXISTS jobs_fingerprint ON jobs (fingerprint)")
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS job_urls (url TEXT PRIMARY KEY, host TEXT NOT NULL, job_id INTEGER NOT NULL)"
+            )
+            self._conn.execute("CREATE INDEX IF NOT EXISTS job_urls_job ON job_urls (job_id, host)")
+            # Stores created before job_urls existed: their primary URLs become the first aliases
+            self._conn.execute(
+                "INSERT OR IGNORE INTO job_urls (url, host, job_id) "
+                "SELECT url, substr(url, 1, instr(url || '/', '/') - 1), job_id FROM jobs WHERE url != ''"
+            )
+
+    # --------------------------------------------
+    # Inserts new jobs and updates known ones
+    # - rows that duplicate an earlier row of the same DataFrame (e.g. found on two platforms) are dropped
+    # Returns the de-duplicated DataFrame with extra columns:
+    # - "Status": "new", "changed" or "unchanged" compared to the store
+    # - "First Seen" / "Last Seen": timestamps from the store
+    # --------------------------------------------
+    def upsert(self, jobs_df):
+        now = time.time()
+        kept_rows = []
+        claimed = set()
+
+        with self._lock, self._conn:
+            for _, row in jobs_df.iterrows():
+                url = normalize_url(row["Job URL"])
+                job_fingerprint = fingerprint(row["Job Title"], row["Company"], row["Location"])
+                row_hash = content_hash(row)
+
+                host = url.split("/")[0]
+
+                existing = None
+                if url:
+                    existing = self._conn.execute(
+                        "SELECT jobs.job_id, content_hash, first_seen FROM job_urls "
+                        "JOIN jobs ON jobs.job_id = job_urls.job_id WHERE job_urls.url = ?", (url,)
+                    ).fetchone()
+                if existing is None:
+                    # A different URL on the same host is a different posting, even with the same fingerprint
+                    existing = self._conn.execute(
+                        "SELECT job_id, content_hash, first_seen FROM jobs WHERE fingerprint = ? AND NOT EXISTS ("
+                        "SELECT 1 FROM job_urls WHERE job_urls.job_id = jobs.job_id AND job_urls.host = ?) "
+                        "ORDER BY last_seen DESC LIMIT 1", (job_fingerprint, host)
+                    ).fetchone()
+
+                if existing is None:
+                    cursor = self._conn.execute(
+                        "INSERT INTO jobs (url, fingerprint, platform, title, company, location, description, "
+                        "job_url, content_hash, first_seen, last_seen) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                        (url, job_fingerprint, row["Platform"], row["Job Title"], row["Company"], row["Location"],
+                         row["Job Description"], row["Job URL"], row_hash, now, now)
+                    )
+                    job_id, status, first_seen = cursor.lastrowid, "new", now
+                else:
+                    job_id, stored_hash, first_seen = existing
+                    if job_id in claimed:
+                        # Same posting already seen earlier in this batch (e.g. on another platform)
+                        continue
+                    status = "unchanged" if stored_hash == row_hash else "changed"
+                    self._conn.execute(
+                        "UPDATE jobs SET url = COALESCE(NULLIF(url, ''), ?), platform = ?, title = ?, company = ?, "
+                        "location = ?, description = ?, job_url = ?, content_hash = ?, last_seen = ? "
+                        "WHERE job_id = ?",
+                        (url, row["Platform"], row["Job Title"], row["Company"], row["Location"],
+                         row["Job Description"], row["Job URL"], row_hash, now, job_id)
+                    )
+
+                if url:
+                    self._conn.execute("INSERT OR IGNORE INTO job_urls (url, host, job_id) VALUES (?, ?, ?)",
+                                       (url, host, job_id))
+                claimed.add(job_id)
+                kept_rows.append({**{column: row[column] for column in JOB_COLUMNS},
+                                  "Status": status, "First Seen": first_seen, "Last Seen": now})
+
+        jobs_data = pd.DataFrame(kept_rows, columns=JOB_COLUMNS + ["Status", "First Seen", "Last Seen"])
+        for column in ("First Seen", "Last Seen"):
+            jobs_data[column] = pd.to_datetime(jobs_data[column], unit="s")
+        return jobs_data
+
+    # Returns every stored job, most recently seen first
+    def load(self):
+        with self._lock:
+            jobs_data = pd.read_sql_query(
+                "SELECT platform AS 'Platform', title AS 'Job Title', company AS 'Company', "
+                "location AS 'Location', description AS 'Job Description', job_url AS 'Job URL', "
+                "first_seen AS 'First Seen', last_seen AS 'Last Seen' FROM jobs ORDER BY last_seen DESC",
+                self._conn
+            )
+        for column in ("First Seen", "Last Seen"):
+            jobs_data[column] = pd.to_datetime(jobs_data[column], unit="s")
+        return jobs_data
+
+    def count(self):
+        with self._lock:
+            return self._conn.execute("SELECT COUNT(*) FROM jobs").fetchone()[0]
+
+
+_default_store = None
+_default_store_lock = threading.Lock()
+
+
+# Returns the process-wide store at STORE_PATH
+def get_default_store():
+    global _default_store
+    with _default_store_lock:
+        if _default_store is None:
+            _default_store = JobStore()
+        return _default_store
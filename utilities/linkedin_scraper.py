@@ -1,131 +1,433 @@
 import os
 import pickle
 import time
+from contextlib import contextmanager
 
 import pandas as pd
+from selenium.common.exceptions import TimeoutException
 from selenium.webdriver.common.by import By
 from selenium.webdriver.common.keys import Keys
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.webdriver.support.ui import WebDriverWait
 
-from utilities.chromedriver_launch import launch_driver
+from utilities.chromedriver_launch import get_driver_pool
+from utilities.metrics import METRICS
+from utilities.text_cleaning import clean_job_description
 
+# --------------------------------------------
+# Wait settings for condition-based waiting
+# - WAIT_TIMEOUT: max seconds to wait for a page condition (filters modal, results list, ...)
+# - DESCRIPTION_TIMEOUT: max seconds to wait for the description pane to switch to a clicked job
+# - POLL_INTERVAL: seconds between condition checks
+# --------------------------------------------
+WAIT_TIMEOUT = 10
+DESCRIPTION_TIMEOUT = 5
+POLL_INTERVAL = 0.2
 
 # --------------------------------------------
-# Scrapes job listings from LinkedIn using Selenium
-# Applies filters: job title, location, job type, date posted, remote option
-# Returns a DataFrame with structured job data
+# Extraction settings
+# - EXTRACTION_MODE: "bulk" reads card data in one script call and fetches descriptions in parallel
+#   inside the browser session; "click" clicks through every card and reads the detail pane
+# - FETCH_CONCURRENCY: parallel description requests per page in bulk mode
+# --------------------------------------------
+EXTRACTION_MODE = "bulk"
+FETCH_CONCURRENCY = 8
+
+JOB_COLUMNS = ['Platform', 'Job Title', 'Company', 'Location', 'Job Description', 'Job URL']
+
+# Locators shared by the scraping steps
+SEARCH_BOX = (By.XPATH, "//input[@aria-label='Search by title, skill, or company']")
+LOCATION_INPUT = (By.XPATH, "//input[@aria-label='City, state, or zip code']")
+ALL_FILTERS_BUTTON = (By.XPATH,
+                      "//button[@aria-label='Show all filters. Clicking this button displays all available filter options.']")
+SHOW_RESULTS_BUTTON = (By.XPATH, "//button[@data-test-reusables-filters-modal-show-results-button='true']")
+JOB_CARDS = (By.XPATH, "//ul/li[@data-occludable-job-id]")
+JOB_ID_ATTRIBUTE = "data-occludable-job-id"
+NEXT_PAGE_BUTTON = (By.XPATH,
+                    "//button[@aria-label='View next page'] | "
+                    "//li[contains(@class, 'artdeco-pagination__indicator--number') and contains(@class, 'active')]"
+                    "/following-sibling::li[1]/button")
+JOB_DESCRIPTION = (By.XPATH, "//div[@class='mt4']/p")
+
+# Reads ID, title, company and location of every job card on the page in one round-trip
+# (title/company/location are empty for cards LinkedIn has not rendered yet)
+CARD_DATA_SCRIPT = """
+return Array.from(document.querySelectorAll("li[data-occludable-job-id]")).map((card) => {
+    const text = (selector) => ((card.querySelector(selector) || {}).textContent || "").trim();
+    return {
+        id: card.getAttribute("data-occludable-job-id"),
+        title: text("a span[aria-hidden]"),
+        company: text(".artdeco-entity-lockup__subtitle span[dir='ltr']"),
+        location: text(".artdeco-entity-lockup__caption span[dir='ltr']")
+    };
+});
+"""
+
+# Fetches the job posting pages of the given IDs from inside the logged-in session,
+# `concurrency` requests at a time, and parses them with the browser's DOMParser
+FETCH_POSTINGS_SCRIPT = """
+const [jobIds, concurrency, done] = arguments;
+const results = {};
+let next = 0;
+async function worker() {
+    while (next < jobIds.length) {
+        const jobId = jobIds[next++];
+        try {
+            const response = await fetch(`/jobs-guest/jobs/api/jobPosting/${jobId}`, {credentials: "include"});
+            if (!response.ok) {
+                throw new Error(`HTTP ${response.status}`);
+            }
+            const page = new DOMParser().parseFromString(await response.text(), "text/html");
+            const text = (selector) => ((page.querySelector(selector) || {}).textContent || "").trim();
+            results[jobId] = {
+                title: text(".top-card-layout__title"),
+                company: text(".topcard__org-name-link"),
+                location: text(".topcard__flavor--bullet"),
+                description: text(".show-more-less-html__markup")
+            };
+        } catch (error) {
+            results[jobId] = {error: String(error)};
+        }
+    }
+}
+Promise.all(Array.from({length: concurrency}, worker)).then(() => done(results));
+"""
+
+
+# --------------------------------------------
+# Records how long a scraping step takes in `timings` (step name -> seconds, summed over repeats)
+# Every occurrence is also recorded in the linkedin_step_seconds histogram (see utilities.metrics)
 # --------------------------------------------
-def scrape_linkedin(job_title, location, num_jobs, remote_option, date_posted, job_type):
-    # Launch a headless Chrome driver instance
-    driver = launch_driver()
+@contextmanager
+def timed_step(timings, step):
+    start = time.perf_counter()
+    try:
+        with METRICS.timer("linkedin_step_seconds", step=step):
+            yield
+    finally:
+        timings[step] = timings.get(step, 0.0) + time.perf_counter() - start
+
+
+def print_timings(timings):
+    summary = ", ".join(f"{step}: {seconds:.2f}s" for step, seconds in timings.items())
+    print(f"LinkedIn scrape timings - {summary}")
+
 
+# --------------------------------------------
+# Logs a new Chrome session into LinkedIn by loading saved cookies
+# Runs once per pooled session, so later searches start already authenticated
+# --------------------------------------------
+def login_linkedin(driver):
     # Step 1: Go to LinkedIn login page
     driver.get("https://www.linkedin.com/")
 
     # Step 2: Load cookies to bypass login
     linkedin_cookies = os.path.abspath("linkedin_cookies.pkl")
-    cookies = pickle.load(open(linkedin_cookies, "rb"))
+    with open(linkedin_cookies, "rb") as cookie_file:
+        cookies = pickle.load(cookie_file)
     for cookie in cookies:
         driver.add_cookie(cookie)
 
-    # Step 3: Navigate to LinkedIn Jobs page
-    driver.get("https://www.linkedin.com/jobs/")
-    time.sleep(3)
-    wait = WebDriverWait(driver, 10)
-
-    # Step 4: Search by job title
-    search_box = wait.until(
-        EC.element_to_be_clickable((By.XPATH, "//input[@aria-label='Search by title, skill, or company']"))
-    )
-    search_box.click()
-    search_box.send_keys(job_title)
-    search_box.send_keys(Keys.ENTER)
-
-    # Step 5: Input location and press Enter
-    location_input = wait.until(
-        EC.element_to_be_clickable((By.XPATH, "//input[@aria-label='City, state, or zip code']"))
-    )
-    location_input.click()
-    location_input.clear()
-    location_input.send_keys(location)
-    location_input.send_keys(Keys.ENTER)
-
-    # Step 6: Open "All filters" panel
-    driver.find_element(By.XPATH,
-                        "//button[@aria-label='Show all filters. Clicking this button displays all available filter options.']").click()
-    time.sleep(2)
-
-    # Step 7: Apply date posted, job type, and remote filters
-    driver.find_element(By.XPATH, f"//label[contains(., '{date_posted}')]").click()
-    driver.find_element(By.XPATH, f"//label[contains(., '{job_type}')]").click()
-    if remote_option:
-        driver.find_element(By.XPATH, f"//label[contains(., 'Remote')]").click()
-    time.sleep(2)
-
-    # Step 8: Click "Show results" button to apply filters
-    driver.find_element(By.XPATH, "//button[@data-test-reusables-filters-modal-show-results-button='true']").click()
-
-    # Step 9: Extract the job results into a DataFrame
-    jobs_list = extract_jobs(driver, num_jobs)
-    jobs_data = pd.DataFrame(jobs_list,
-                             columns=['Platform', 'Job Title', 'Company', 'Location', 'Job Description', 'Job URL'])
-
-    # Step 10: Close browser session
-    driver.quit()
+
+def get_linkedin_pool():
+    return get_driver_pool("linkedin", warmup=login_linkedin)
+
+
+# --------------------------------------------
+# Scrapes job listings from LinkedIn using Selenium
+# Applies filters: job title, location, job type, date posted, remote option
+# Returns a DataFrame with structured job data; per-step timings are kept in jobs_data.attrs["step_timings"]
+# --------------------------------------------
+def scrape_linkedin(job_title, location, num_jobs, remote_option, date_posted, job_type,
+                    wait_timeout=WAIT_TIMEOUT, poll_interval=POLL_INTERVAL, extraction_mode=EXTRACTION_MODE):
+    timings = {}
+    chunks = list(stream_linkedin(job_title, location, num_jobs, remote_option, date_posted, job_type,
+                                  wait_timeout, poll_interval, timings, extraction_mode))
+    jobs_data = pd.concat(chunks, ignore_index=True) if chunks else pd.DataFrame(columns=JOB_COLUMNS)
+    jobs_data.attrs["step_timings"] = timings
     return jobs_data
 
 
+# --------------------------------------------
+# Streaming variant of scrape_linkedin
+# Yields a one-row DataFrame per job as soon as it is extracted, scrolling and paginating
+# through the results until num_jobs jobs have been found or the results run out
+# Step timings are recorded in `timings` if a dict is passed in
+# --------------------------------------------
+def stream_linkedin(job_title, location, num_jobs, remote_option, date_posted, job_type,
+                    wait_timeout=WAIT_TIMEOUT, poll_interval=POLL_INTERVAL, timings=None,
+                    extraction_mode=EXTRACTION_MODE):
+    timings = {} if timings is None else timings
+
+    # Check out a warm, already logged-in Chrome session from the pool
+    pool = get_linkedin_pool()
+    with timed_step(timings, "checkout_driver"):
+        driver = pool.checkout()
+    wait = WebDriverWait(driver, wait_timeout, poll_frequency=poll_interval)
+
+    healthy = False
+    try:
+        with timed_step(timings, "search"):
+            # Step 3: Navigate to LinkedIn Jobs page
+            driver.get("https://www.linkedin.com/jobs/")
+
+            # Step 4: Search by job title (waits until the search box is ready)
+            search_box = wait.until(EC.element_to_be_clickable(SEARCH_BOX))
+            search_box.click()
+            search_box.send_keys(job_title)
+            search_box.send_keys(Keys.ENTER)
+
+            # Step 5: Input location and press Enter
+            location_input = wait.until(EC.element_to_be_clickable(LOCATION_INPUT))
+            location_input.click()
+            location_input.clear()
+            location_input.send_keys(location)
+            location_input.send_keys(Keys.ENTER)
+
+        with timed_step(timings, "filters"):
+            # Step 6: Open "All filters" panel and wait for the modal to appear
+            wait.until(EC.element_to_be_clickable(ALL_FILTERS_BUTTON)).click()
+            wait.until(EC.presence_of_element_located(SHOW_RESULTS_BUTTON))
+
+            # Step 7: Apply date posted, job type, and remote filters
+            wait.until(EC.element_to_be_clickable((By.XPATH, f"//label[contains(., '{date_posted}')]"))).click()
+            wait.until(EC.element_to_be_clickable((By.XPATH, f"//label[contains(., '{job_type}')]"))).click()
+            if remote_option:
+                wait.until(EC.element_to_be_clickable((By.XPATH, f"//label[contains(., 'Remote')]"))).click()
+
+            # Step 8: Click "Show results" button to apply filters
+            wait.until(EC.element_to_be_clickable(SHOW_RESULTS_BUTTON)).click()
+
+        # Step 9: Stream the job results, one row at a time
+        if extraction_mode == "bulk":
+            jobs = iter_jobs_bulk(driver, num_jobs, wait_timeout=wait_timeout, poll_interval=poll_interval)
+        else:
+            jobs = iter_jobs(driver, num_jobs, wait_timeout=wait_timeout, poll_interval=poll_interval)
+        while True:
+            with timed_step(timings, "extract_jobs"):
+                job = next(jobs, None)
+            if job is None:
+                break
+            job['Job Description'] = clean_job_description(job.get('Job Description') or "")
+            yield pd.DataFrame([job], columns=JOB_COLUMNS)
+        healthy = True
+    finally:
+        # Step 10: Return the session to the pool (it is discarded if the browser is no longer healthy)
+        pool.checkin(driver, healthy=healthy or pool.is_healthy(driver))
+        print_timings(timings)
+
+
+# --------------------------------------------
+# Wait condition: the description pane shows the clicked job
+# - the URL points at the job ID and the description text differs from the previous job's
+# Returns the description text once loaded, otherwise False (keeps WebDriverWait polling)
+# --------------------------------------------
+def description_loaded(job_id, previous_description):
+    def condition(driver):
+        if f"currentJobId={job_id}" not in driver.current_url:
+            return False
+        elements = driver.find_elements(*JOB_DESCRIPTION)
+        if not elements:
+            return False
+        description = elements[0].get_attribute("textContent").strip()
+        return description if description and description != previous_description else False
+
+    return condition
+
+
+# Text the description pane currently shows ("" if there is no pane yet)
+def read_description(driver):
+    elements = driver.find_elements(*JOB_DESCRIPTION)
+    return elements[0].get_attribute("textContent").strip() if elements else ""
+
+
 # --------------------------------------------
 # Helper function to extract job data from LinkedIn job cards
 # Returns a list of dictionaries, each representing a job
 # --------------------------------------------
-def extract_jobs(driver, num_jobs):
-    time.sleep(3)
-    # Locate all job listing elements
-    jobs = driver.find_elements(By.XPATH, "/html/body/div[6]/div[3]/div[4]/div/div/main/div/div[2]/div[1]/div/ul/li")
-
-    job_data = []
-    for job in jobs[:num_jobs]:  # Limit to desired number of jobs
-        try:
-            time.sleep(1)
-            # Extract job title
-            title_element = job.find_element(By.XPATH, ".//a/span[@aria-hidden]")
-            title = title_element.get_attribute("textContent").strip()
-
-            # Extract company name
-            company_element = job.find_element(By.XPATH,
-                                               ".//div[@class='artdeco-entity-lockup__subtitle ember-view']//span[@dir='ltr']")
-            company = company_element.get_attribute("textContent").strip()
-
-            # Extract location
-            location_element = job.find_element(By.XPATH,
-                                                ".//div[@class='artdeco-entity-lockup__caption ember-view']//span[@dir='ltr']")
-            location = location_element.get_attribute("textContent").strip()
-
-            # Generate job URL from job ID
-            job_id_element = job.find_element(By.XPATH, ".//div[@data-job-id]")
-            job_id = job_id_element.get_attribute("data-job-id")
-            job_url = f"https://www.linkedin.com/jobs/view/{job_id}"
-
-            # Click job to load full description
-            job.find_element(By.XPATH, ".//a").click()
-            driver.execute_script("arguments[0].scrollIntoView();", job)
-
-            # Extract job description text
-            job_description = driver.find_element(By.XPATH, "//div[@class='mt4']/p").get_attribute(
-                "textContent").strip()
-
-            # Append job data as dictionary
-            job_data.append({
-                "Platform": "LinkedIn",
-                "Job Title": title,
-                "Company": company,
-                "Location": location,
-                "Job Description": job_description,
-                "Job URL": job_url
-            })
-        except Exception as e:
-            print(f"Skipping job due to error: {e}")
-
-    return job_data
+def extract_jobs(driver, num_jobs, wait_timeout=WAIT_TIMEOUT, poll_interval=POLL_INTERVAL):
+    return list(iter_jobs(driver, num_jobs, wait_timeout=wait_timeout, poll_interval=poll_interval))
+
+
+# --------------------------------------------
+# Generator over the job cards of the current search, yielding one dictionary per job
+# - scrolls each card into view so lazily rendered cards get loaded
+# - re-reads the list after each pass to pick up cards appended while scrolling
+# - moves to the next results page until num_jobs jobs are yielded or there are no more pages
+# - skips job IDs in seen_ids (and any ID already yielded)
+# --------------------------------------------
+def iter_jobs(driver, num_jobs, seen_ids=None, wait_timeout=WAIT_TIMEOUT, poll_interval=POLL_INTERVAL):
+    wait = WebDriverWait(driver, wait_timeout, poll_frequency=poll_interval)
+    description_wait = WebDriverWait(driver, DESCRIPTION_TIMEOUT, poll_frequency=poll_interval)
+    seen_ids = set(seen_ids or ())
+
+    yielded = 0
+    previous_description = None
+    while yielded < num_jobs:
+        # Wait until the results list is populated
+        wait.until(EC.presence_of_all_elements_located(JOB_CARDS))
+
+        visited = set()
+        while yielded < num_jobs:
+            cards = [card for card in driver.find_elements(*JOB_CARDS)
+                     if card.get_attribute(JOB_ID_ATTRIBUTE) not in visited]
+            if not cards:
+                break
+
+            for card in cards:
+                job_id = card.get_attribute(JOB_ID_ATTRIBUTE)
+                visited.add(job_id)
+                if not job_id or job_id in seen_ids:
+                    continue
+                seen_ids.add(job_id)
+
+                try:
+                    job = extract_card(driver, card, job_id, previous_description, wait, description_wait)
+                except Exception as e:
+                    METRICS.inc("scrape_job_errors_total", platform="LinkedIn", error=type(e).__name__)
+                    print(f"Skipping job due to error: {e}")
+                    continue
+
+                previous_description = job["Job Description"]
+                yield job
+                yielded += 1
+                if yielded >= num_jobs:
+                    return
+
+        if not go_to_next_page(driver, wait):
+            return
+
+
+# --------------------------------------------
+# Faster alternative to iter_jobs that never clicks through the UI
+# - collects the data of all cards on a page with one execute_script call
+# - fetches the descriptions of the page's new jobs in parallel within the same browser session
+# - jobs whose posting could not be fetched (or the whole page, if the fetch script fails or times out)
+#   fall back to clicking their card
+# Yields the same dictionaries as iter_jobs
+# --------------------------------------------
+def iter_jobs_bulk(driver, num_jobs, seen_ids=None, wait_timeout=WAIT_TIMEOUT, poll_interval=POLL_INTERVAL,
+                   fetch_concurrency=FETCH_CONCURRENCY):
+    wait = WebDriverWait(driver, wait_timeout, poll_frequency=poll_interval)
+    description_wait = WebDriverWait(driver, DESCRIPTION_TIMEOUT, poll_frequency=poll_interval)
+    seen_ids = set(seen_ids or ())
+    # The script timeout is raised only around the fetch, since pooled sessions are reused by later scrapes
+    script_timeout = driver.timeouts.script
+
+    yielded = 0
+    while yielded < num_jobs:
+        # Wait until the results list is populated, then read every card in one call
+        wait.until(EC.presence_of_all_elements_located(JOB_CARDS))
+        cards = [card for card in driver.execute_script(CARD_DATA_SCRIPT)
+                 if card["id"] and card["id"] not in seen_ids]
+        cards = cards[:num_jobs - yielded]
+        seen_ids.update(card["id"] for card in cards)
+
+        postings = {}
+        if cards:
+            try:
+                # Allow enough time for a whole page of parallel requests
+                driver.set_script_timeout(wait_timeout * 3)
+                postings = driver.execute_async_script(FETCH_POSTINGS_SCRIPT, [card["id"] for card in cards],
+                                                       fetch_concurrency) or {}
+            except Exception as e:
+                METRICS.inc("scrape_job_errors_total", platform="LinkedIn", error=type(e).__name__)
+                print(f"Fetching job postings failed, clicking through the cards instead: {e}")
+            finally:
+                driver.set_script_timeout(script_timeout)
+
+        for card in cards:
+            job_id = card["id"]
+            posting = postings.get(job_id) or {}
+            try:
+                if posting.get("description"):
+                    job = {
+                        "Platform": "LinkedIn",
+                        "Job Title": card["title"] or posting["title"],
+                        "Company": card["company"] or posting["company"],
+                        "Location": card["location"] or posting["location"],
+                        "Job Description": posting["description"],
+                        "Job URL": f"https://www.linkedin.com/jobs/view/{job_id}"
+                    }
+                else:
+                    METRICS.inc("linkedin_click_fallbacks_total")
+                    card_element = driver.find_element(By.XPATH, f"//li[@{JOB_ID_ATTRIBUTE}='{job_id}']")
+                    # The pane may still show another job; its text must change before this job's is read
+                    job = extract_card(driver, card_element, job_id, read_description(driver), wait,
+                                       description_wait)
+            except Exception as e:
+                METRICS.inc("scrape_job_errors_total", platform="LinkedIn", error=type(e).__name__)
+                print(f"Skipping job due to error: {e}")
+                continue
+
+            yield job
+            yielded += 1
+
+        if yielded >= num_jobs or not go_to_next_page(driver, wait):
+            return
+
+
+# --------------------------------------------
+# Extracts a single job card, clicking it to load the full description
+# --------------------------------------------
+def extract_card(driver, card, job_id, previous_description, wait, description_wait):
+    # Bring the card into view so its (lazily rendered) content gets loaded
+    driver.execute_script("arguments[0].scrollIntoView({block: 'center'});", card)
+    wait.until(lambda _: card.find_elements(By.XPATH, ".//a/span[@aria-hidden]"))
+
+    # Extract job title
+    title_element = card.find_element(By.XPATH, ".//a/span[@aria-hidden]")
+    title = title_element.get_attribute("textContent").strip()
+
+    # Extract company name
+    company_element = card.find_element(By.XPATH,
+                                        ".//div[@class='artdeco-entity-lockup__subtitle ember-view']//span[@dir='ltr']")
+    company = company_element.get_attribute("textContent").strip()
+
+    # Extract location
+    location_element = card.find_element(By.XPATH,
+                                         ".//div[@class='artdeco-entity-lockup__caption ember-view']//span[@dir='ltr']")
+    location = location_element.get_attribute("textContent").strip()
+
+    # Generate job URL from job ID
+    job_url = f"https://www.linkedin.com/jobs/view/{job_id}"
+
+    # Click job to load full description
+    card.find_element(By.XPATH, ".//a").click()
+
+    # Wait for the description pane to switch to this job, then read the description text
+    try:
+        job_description = description_wait.until(description_loaded(job_id, previous_description))
+    except TimeoutException:
+        # A click that didn't take leaves the previous job in the pane; skip the job rather than mislabel it
+        if f"currentJobId={job_id}" not in driver.current_url:
+            raise TimeoutException(f"Description pane did not switch to job {job_id}")
+        # Identical descriptions never "change"; fall back to whatever the pane shows now
+        job_description = read_description(driver)
+        if not job_description:
+            raise TimeoutException(f"Description of job {job_id} did not load")
+
+    return {
+        "Platform": "LinkedIn",
+        "Job Title": title,
+        "Company": company,
+        "Location": location,
+        "Job Description": job_description,
+        "Job URL": job_url
+    }
+
+
+# --------------------------------------------
+# Clicks through to the next results page
+# Returns False when there is no next page, otherwise waits until the new page's cards replace the old ones
+# --------------------------------------------
+def go_to_next_page(driver, wait):
+    buttons = driver.find_elements(*NEXT_PAGE_BUTTON)
+    if not buttons or not buttons[0].is_enabled():
+        return False
+
+    first_card = driver.find_elements(*JOB_CARDS)
+    buttons[0].click()
+    if first_card:
+        wait.until(EC.staleness_of(first_card[0]))
+    return True
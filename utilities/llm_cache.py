@@ -0,0 +1,217 @@
+import hashlib
+import json
+from array import array
+import os
+import sqlite3
+import threading
+import time
+
+from langchain_core.embeddings import Embeddings
+
+from utilities.context_builder import count_tokens
+from utilities.metrics import METRICS, record_token_usage
+
+# --------------------------------------------
+# Cache settings
+# - CACHE_PATH: SQLite file holding LLM results and embeddings
+# - CACHE_TTL: seconds an entry stays valid (None keeps entries forever)
+# - CACHE_MAX_ENTRIES: per-table cap; least recently used entries are evicted first
+# - EVICT_INTERVAL: seconds between sweeps for expired entries (the size cap is checked on every write)
+# - EVICT_LOW_WATER: a table over its cap is trimmed to this fraction of it, so evictions stay rare
+# --------------------------------------------
+CACHE_PATH = os.path.abspath("Resources/llm_cache.sqlite")
+CACHE_TTL = 30 * 24 * 60 * 60
+CACHE_MAX_ENTRIES = 50000
+EVICT_INTERVAL = 60 * 60
+EVICT_LOW_WATER = 0.9
+
+TABLES = ("llm_results", "embeddings")
+# Tables holding embedding vectors, stored as float32 blobs instead of JSON text
+VECTOR_TABLES = {"embeddings"}
+
+
+# --------------------------------------------
+# Builds a content-addressed cache key from any number of string parts
+# --------------------------------------------
+def make_key(*parts):
+    payload = json.dumps([str(part) for part in parts], ensure_ascii=False)
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+# Encodes a value for storage: vectors as packed float32, everything else as JSON
+def encode_value(table, value):
+    if table in VECTOR_TABLES:
+        return array("f", value).tobytes()
+    return json.dumps(value)
+
+
+# Entries written before vectors were packed are still JSON text
+def decode_value(value):
+    if isinstance(value, bytes):
+        return array("f", value).tolist()
+    return json.loads(value)
+
+
+# --------------------------------------------
+# Persistent SQLite cache for LLM match results and embedding vectors
+# Values are stored as JSON (vectors as float32 blobs); hit/miss counters are kept per instance
+# Writes only trigger an eviction once a table grows past max_entries; expired entries are swept
+# at most every EVICT_INTERVAL seconds
+# --------------------------------------------
+class LLMCache:
+    def __init__(self, path=CACHE_PATH, ttl=CACHE_TTL, max_entries=CACHE_MAX_ENTRIES):
+        self.path = path
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+        self._last_sweep = 0.0
+
+        if path != ":memory:":
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        with self._conn:
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            for table in TABLES:
+                self._conn.execute(
+                    f"CREATE TABLE IF NOT EXISTS {table} ("
+                    "key TEXT PRIMARY KEY, value TEXT NOT NULL, created_at REAL NOT NULL, accessed_at REAL NOT NULL)"
+                )
+                self._conn.execute(f"CREATE INDEX IF NOT EXISTS {table}_accessed_at ON {table} (accessed_at)")
+        # Also sets _sizes: an upper bound of the rows in each table, re-counted once it passes max_entries
+        self.evict()
+
+    # Returns the cached values for the given keys as {key: value}; missing or expired keys are left out
+    def get_many(self, table, keys):
+        keys = list(keys)
+        if not keys:
+            return {}
+        now = time.time()
+        found = {}
+        with self._lock, self._conn:
+            # SQLite limits the number of bound parameters, so look keys up in slices
+            for start in range(0, len(keys), 500):
+                batch = keys[start:start + 500]
+                placeholders = ",".join("?" * len(batch))
+                rows = self._conn.execute(
+                    f"SELECT key, value, created_at FROM {table} WHERE key IN ({placeholders})", batch
+                ).fetchall()
+                for key, value, created_at in rows:
+                    if self.ttl is None or now - created_at <= self.ttl:
+                        found[key] = decode_value(value)
+            if found:
+                self._conn.executemany(f"UPDATE {table} SET accessed_at = ? WHERE key = ?",
+                                       [(now, key) for key in found])
+            self.hits += len(found)
+            self.misses += len(keys) - len(found)
+        METRICS.inc("cache_hits_total", len(found), table=table)
+        METRICS.inc("cache_misses_total", len(keys) - len(found), table=table)
+        return found
+
+    def get(self, table, key):
+        return self.get_many(table, [key]).get(key)
+
+    # Stores {key: value} pairs, replacing existing entries
+    def set_many(self, table, items):
+        if not items:
+            return
+        now = time.time()
+        with self._lock, self._conn:
+            self._conn.executemany(
+                f"INSERT OR REPLACE INTO {table} (key, value, created_at, accessed_at) VALUES (?, ?, ?, ?)",
+                [(key, encode_value(table, value), now, now) for key, value in items.items()]
+            )
+            # Replaced keys are counted as new rows, so the estimate only errs towards evicting early
+            self._sizes[table] += len(items)
+            over_cap = self.max_entries is not None and self._sizes[table] > self.max_entries
+        if over_cap or (self.ttl is not None and now - self._last_sweep > EVICT_INTERVAL):
+            self.evict()
+
+    def set(self, table, key, value):
+        self.set_many(table, {key: value})
+
+    # Drops expired entries, then trims each table over max_entries down to EVICT_LOW_WATER of it
+    # by least recent access
+    def evict(self):
+        now = time.time()
+        with self._lock, self._conn:
+            for table in TABLES:
+                if self.ttl is not None:
+                    self._conn.execute(f"DELETE FROM {table} WHERE created_at < ?", (now - self.ttl,))
+                if self.max_entries is not None and self._count(table) > self.max_entries:
+                    self._conn.execute(
+                        f"DELETE FROM {table} WHERE key IN ("
+                        f"SELECT key FROM {table} ORDER BY accessed_at DESC LIMIT -1 OFFSET ?)",
+                        (int(self.max_entries * EVICT_LOW_WATER),)
+                    )
+            self._sizes = {table: self._count(table) for table in TABLES}
+            self._last_sweep = now
+
+    def _count(self, table):
+        return self._conn.execute(f"SELECT COUNT(*) FROM {table}").fetchone()[0]
+
+    def clear(self):
+        with self._lock, self._conn:
+            for table in TABLES:
+                self._conn.execute(f"DELETE FROM {table}")
+            self._sizes = dict.fromkeys(TABLES, 0)
+
+    def stats(self):
+        with self._lock:
+            sizes = {table: self._count(table) for table in TABLES}
+        return {"hits": self.hits, "misses": self.misses, **sizes}
+
+
+# --------------------------------------------
+# Embeddings wrapper that serves vectors from the cache and only
+# sends uncached texts to the underlying model (in one batched call)
+# Latency and tokens of those calls are recorded in utilities.metrics
+# --------------------------------------------
+class CachedEmbeddings(Embeddings):
+    def __init__(self, underlying, cache, model_name=None):
+        self.underlying = underlying
+        self.cache = cache
+        self.model_name = model_name or getattr(underlying, "model", None) or type(underlying).__name__
+
+    def _key(self, text):
+        return make_key("embedding", self.model_name, text)
+
+    def embed_documents(self, texts):
+        keys = [self._key(text) for text in texts]
+        cached = self.cache.get_many("embeddings", keys)
+
+        missing = [i for i, key in enumerate(keys) if key not in cached]
+        if missing:
+            missing_texts = [texts[i] for i in missing]
+            with METRICS.timer("embedding_request_seconds", model=self.model_name):
+                vectors = self.underlying.embed_documents(missing_texts)
+            record_token_usage(self.model_name, sum(count_tokens(text) for text in missing_texts))
+            new_items = {keys[i]: list(vector) for i, vector in zip(missing, vectors)}
+            self.cache.set_many("embeddings", new_items)
+            cached.update(new_items)
+
+        return [cached[key] for key in keys]
+
+    def embed_query(self, text):
+        key = self._key(text)
+        vector = self.cache.get("embeddings", key)
+        if vector is None:
+            with METRICS.timer("embedding_request_seconds", model=self.model_name):
+                vector = list(self.underlying.embed_query(text))
+            record_token_usage(self.model_name, count_tokens(text))
+            self.cache.set("embeddings", key, vector)
+        return vector
+
+
+_default_cache = None
+_default_cache_lock = threading.Lock()
+
+
+# Returns the process-wide cache stored at CACHE_PATH
+def get_default_cache():
+    global _default_cache
+    with _default_cache_lock:
+        if _default_cache is None:
+            _default_cache = LLMCache()
+        return _default_cache
@@ -0,0 +1,141 @@
+import hashlib
+import os
+import threading
+from collections import OrderedDict
+from functools import lru_cache
+
+import httpx
+from langchain.text_splitter import CharacterTextSplitter
+from langchain_community.vectorstores import FAISS
+from langchain_openai import OpenAIEmbeddings, ChatOpenAI
+
+from utilities.llm_cache import CachedEmbeddings, get_default_cache
+
+# Load your OpenAI API key from environment variables
+openai_api_key = os.getenv("OPENAI_API_KEY")
+
+# --------------------------------------------
+# Resume index settings
+# - INDEX_DIR: where FAISS indexes are saved, one sub-folder per resume hash
+# - MAX_INDEXES_IN_MEMORY: how many resume indexes are kept in memory (least recently used dropped first)
+# - CHAT_MODEL: model used for evaluation
+# - MAX_CONNECTIONS: size of the HTTP connection pool shared by the OpenAI clients
+# --------------------------------------------
+INDEX_DIR = os.path.abspath("Resources/resume_indexes")
+MAX_INDEXES_IN_MEMORY = 8
+CHAT_MODEL = "gpt-4o"
+MAX_CONNECTIONS = 20
+
+
+# --------------------------------------------
+# Long-lived OpenAI clients
+# Both share one pooled HTTP client so connections are reused across evaluations
+# --------------------------------------------
+@lru_cache(maxsize=None)
+def get_http_client():
+    return httpx.Client(limits=httpx.Limits(max_connections=MAX_CONNECTIONS,
+                                            max_keepalive_connections=MAX_CONNECTIONS))
+
+
+@lru_cache(maxsize=None)
+def get_llm(request_timeout):
+    # Client-side retries are disabled; retry/backoff is handled per request by gpt_parser
+    # JSON mode makes the model always answer with a JSON object (validated by utilities.evaluation_schema)
+    return ChatOpenAI(model=CHAT_MODEL, api_key=openai_api_key, timeout=request_timeout, max_retries=0,
+                      http_client=get_http_client(), model_kwargs={"response_format": {"type": "json_object"}})
+
+
+@lru_cache(maxsize=None)
+def get_embeddings():
+    return OpenAIEmbeddings(api_key=openai_api_key, http_client=get_http_client())
+
+
+# Split the resume into overlapping text chunks for better vector representation
+def split_resume(resume_text):
+    text_splitter = CharacterTextSplitter(
+        separator="\n",
+        chunk_size=1500,
+        chunk_overlap=200,
+        length_function=len
+    )
+    return text_splitter.split_text(resume_text)
+
+
+# --------------------------------------------
+# Everything evaluate_job_matches needs about one resume, built once per resume:
+# - chunks / chunk_vectors: the split resume and its embeddings
+# - docsearch: FAISS vector store of the chunks
+# - embeddings: the (cached) embeddings client used for queries against docsearch
+# --------------------------------------------
+class ResumeIndex:
+    def __init__(self, resume_hash, chunks, chunk_vectors, docsearch, embeddings):
+        self.resume_hash = resume_hash
+        self.chunks = chunks
+        self.chunk_vectors = chunk_vectors
+        self.docsearch = docsearch
+        self.embeddings = embeddings
+
+    # Embeds the resume and builds its FAISS index
+    @classmethod
+    def build(cls, resume_text, embeddings):
+        chunks = split_resume(resume_text)
+        chunk_vectors = embeddings.embed_documents(chunks)
+        docsearch = FAISS.from_embeddings(list(zip(chunks, chunk_vectors)), embeddings)
+        return cls(resume_hash(resume_text), chunks, chunk_vectors, docsearch, embeddings)
+
+    def save(self, index_dir=INDEX_DIR):
+        self.docsearch.save_local(index_path(self.resume_hash, self.embeddings, index_dir))
+
+    # Loads an index saved with save(); returns None if there is none for this resume
+    @classmethod
+    def load(cls, resume_text, embeddings, index_dir=INDEX_DIR):
+        path = index_path(resume_hash(resume_text), embeddings, index_dir)
+        if not os.path.isdir(path):
+            return None
+        # The index files are written by this application only
+        docsearch = FAISS.load_local(path, embeddings, allow_dangerous_deserialization=True)
+        count = docsearch.index.ntotal
+        chunks = [docsearch.docstore.search(docsearch.index_to_docstore_id[i]).page_content for i in range(count)]
+        chunk_vectors = docsearch.index.reconstruct_n(0, count).tolist()
+        return cls(resume_hash(resume_text), chunks, chunk_vectors, docsearch, embeddings)
+
+
+def resume_hash(resume_text):
+    return hashlib.sha256(resume_text.encode("utf-8")).hexdigest()
+
+
+# Saved indexes are specific to the embedding model they were built with
+def index_path(resume_hash_value, embeddings, index_dir=INDEX_DIR):
+    model_name = getattr(embeddings, "model_name", None) or getattr(embeddings, "model", None) or "default"
+    return os.path.join(index_dir, f"{model_name}-{resume_hash_value}")
+
+
+_indexes = OrderedDict()
+_indexes_lock = threading.Lock()
+
+
+# --------------------------------------------
+# Returns the ResumeIndex of a resume, reusing it from memory or disk when possible
+# Only a resume that has never been seen is split and embedded (and then saved to disk)
+# --------------------------------------------
+def get_resume_index(resume_text, use_cache=True, index_dir=INDEX_DIR):
+    key = (resume_hash(resume_text), use_cache)
+    with _indexes_lock:
+        if key in _indexes:
+            _indexes.move_to_end(key)
+            return _indexes[key]
+
+    embeddings = get_embeddings()
+    if use_cache:
+        embeddings = CachedEmbeddings(embeddings, get_default_cache())
+
+    resume_index = ResumeIndex.load(resume_text, embeddings, index_dir)
+    if resume_index is None:
+        resume_index = ResumeIndex.build(resume_text, embeddings)
+        resume_index.save(index_dir)
+
+    with _indexes_lock:
+        _indexes[key] = resume_index
+        while len(_indexes) > MAX_INDEXES_IN_MEMORY:
+            _indexes.popitem(last=False)
+    return resume_index
@@ -0,0 +1,132 @@
+import hashlib
+import io
+import os
+import threading
+import zipfile
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
+from xml.etree import ElementTree
+
+from pypdf import PdfReader
+
+from utilities.metrics import METRICS
+
+# --------------------------------------------
+# Resume ingestion settings
+# - SUPPORTED_TYPES: file extensions accepted as resumes
+# - PARALLEL_MIN_PAGES: with parallel=True, PDFs with at least this many pages are extracted by several processes
+#   (benchmarks/bench_resume.py: ~8-15 ms per text page sequentially, ~450 ms to start a pool of spawned workers
+#   and ~15 ms with fork, so on spawn platforms 4 workers only win past ~60 pages; resumes are far shorter)
+# - MAX_WORKERS: max processes used for one PDF
+# - MAX_CACHED_RESUMES: parsed texts kept in memory, keyed by file hash (least recently used dropped first)
+# --------------------------------------------
+SUPPORTED_TYPES = ("pdf", "docx", "txt")
+PARALLEL_MIN_PAGES = 64
+MAX_WORKERS = min(4, os.cpu_count() or 1)
+MAX_CACHED_RESUMES = 32
+
+WORD_NAMESPACE = "{http://schemas.openxmlformats.org/wordprocessingml/2006/main}"
+
+
+# --------------------------------------------
+# Extracts the text of a resume file
+# - source: file contents (bytes) or a path
+# - filename: used to pick the format from its extension (defaults to the path)
+# - parallel: allow long PDFs to be split across worker processes; only for scripts that start from an
+#   `if __name__ == "__main__":` guard (e.g. harvest.py), never the Streamlit app, since spawned workers
+#   re-import the main module
+# Parsed texts are cached by the hash of the file contents, so the same upload is only parsed once
+# Returns the stripped text (empty for e.g. scanned PDFs without a text layer);
+# raises ValueError for unsupported file types
+# --------------------------------------------
+def read_resume(source, filename=None, parallel=False):
+    if isinstance(source, (str, os.PathLike)):
+        filename = filename or os.fspath(source)
+        with open(source, "rb") as resume_file:
+            source = resume_file.read()
+
+    file_type = os.path.splitext(filename or "")[1].lower().lstrip(".")
+    if file_type not in SUPPORTED_TYPES:
+        raise ValueError(f"Unsupported resume type '{file_type}'; expected one of {', '.join(SUPPORTED_TYPES)}")
+
+    key = (hashlib.sha256(source).hexdigest(), file_type)
+    with _texts_lock:
+        if key in _texts:
+            _texts.move_to_end(key)
+            METRICS.inc("cache_hits_total", table="resume_text")
+            return _texts[key]
+    METRICS.inc("cache_misses_total", table="resume_text")
+
+    with METRICS.timer("resume_parse_seconds", format=file_type):
+        text = (read_pdf(source, parallel) if file_type == "pdf" else READERS[file_type](source)).strip()
+
+    with _texts_lock:
+        _texts[key] = text
+        while len(_texts) > MAX_CACHED_RESUMES:
+            _texts.popitem(last=False)
+    return text
+
+
+# --------------------------------------------
+# PDF text, one page per line block
+# With parallel=True, documents of at least min_pages pages are split into page ranges extracted in
+# worker processes (pypdf is pure Python, so threads would not run in parallel); each process
+# opens its own reader on the file contents
+# --------------------------------------------
+def read_pdf(data, parallel=False, min_pages=PARALLEL_MIN_PAGES):
+    page_count = len(PdfReader(io.BytesIO(data)).pages)
+    if not parallel or page_count < min_pages or MAX_WORKERS < 2:
+        return "\n".join(extract_pdf_pages(data, 0, page_count))
+
+    step = -(-page_count // MAX_WORKERS)
+    ranges = [(start, min(start + step, page_count)) for start in range(0, page_count, step)]
+    try:
+        with ProcessPoolExecutor(max_workers=len(ranges)) as executor:
+            parts = list(executor.map(extract_pdf_pages, [data] * len(ranges), *zip(*ranges)))
+    except Exception as e:
+        # e.g. process creation not allowed in this environment; extract in this process instead
+        print(f"Parallel PDF extraction failed, extracting sequentially: {e}")
+        parts = [extract_pdf_pages(data, 0, page_count)]
+    return "\n".join(page for pages in parts for page in pages)
+
+
+# Texts of pages start..end-1 (module-level so it can run in a worker process)
+def extract_pdf_pages(data, start, end):
+    pages = PdfReader(io.BytesIO(data)).pages
+    return [pages[i].extract_text() or "" for i in range(start, end)]
+
+
+# --------------------------------------------
+# DOCX text read straight from word/document.xml (standard library only)
+# One line per paragraph; tabs and line breaks inside paragraphs are kept
+# --------------------------------------------
+def read_docx(data):
+    with zipfile.ZipFile(io.BytesIO(data)) as docx:
+        root = ElementTree.fromstring(docx.read("word/document.xml"))
+
+    paragraphs = []
+    for paragraph in root.iter(f"{WORD_NAMESPACE}p"):
+        parts = []
+        for element in paragraph.iter():
+            if element.tag == f"{WORD_NAMESPACE}t":
+                parts.append(element.text or "")
+            elif element.tag == f"{WORD_NAMESPACE}tab":
+                parts.append("\t")
+            elif element.tag in (f"{WORD_NAMESPACE}br", f"{WORD_NAMESPACE}cr"):
+                parts.append("\n")
+        paragraphs.append("".join(parts))
+    return "\n".join(paragraphs)
+
+
+# Plain text; UTF-8 (with or without BOM), falling back to Windows-1252 for older files
+def read_txt(data):
+    try:
+        return data.decode("utf-8-sig")
+    except UnicodeDecodeError:
+        return data.decode("cp1252", errors="replace")
+
+
+READERS = {"pdf": read_pdf, "docx": read_docx, "txt": read_txt}
+
+_texts = OrderedDict()
+_texts_lock = threading.Lock()
@@ -0,0 +1,93 @@
+import importlib
+import queue
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pandas as pd
+
+from utilities.metrics import METRICS
+
+# --------------------------------------------
+# Registry of platform name -> scraper function
+# Every scraper takes (job_title, location, num_jobs, remote_option, date_posted, job_type)
+# and returns a DataFrame with the standard job columns
+# A platform may also register a streaming function with the same arguments that yields
+# DataFrame chunks as jobs arrive; the orchestrator then prefers it so rows can be shown early
+# Functions can be given as "module:function" strings; they are imported on first use, so listing
+# the platforms does not load Selenium or the Apify client
+# --------------------------------------------
+SCRAPERS = {}
+STREAMERS = {}
+
+
+def register_scraper(platform, scraper, stream=None):
+    SCRAPERS[platform] = scraper
+    if stream is not None:
+        STREAMERS[platform] = stream
+
+
+# Imports a "module:function" reference; callables are returned unchanged
+def resolve(target):
+    if callable(target):
+        return target
+    module_name, function_name = target.split(":")
+    return getattr(importlib.import_module(module_name), function_name)
+
+
+register_scraper("LinkedIn", "utilities.linkedin_scraper:scrape_linkedin",
+                 stream="utilities.linkedin_scraper:stream_linkedin")
+register_scraper("Indeed", "utilities.indeed_scraper:scrape_indeed", stream="utilities.indeed_scraper:stream_indeed")
+# Future integrations can be registered here:
+# register_scraper("Glassdoor", scrape_glassdoor)
+# register_scraper("Zip Recruiter", scrape_ziprecruiter)
+
+
+# --------------------------------------------
+# Runs the scrapers of the selected platforms at the same time
+# Yields events as (platform, status, payload) in the order they happen:
+# - ("started", None) when a platform's scraper begins
+# - ("rows", DataFrame) for each chunk of jobs a streaming scraper yields
+# - ("done", DataFrame) when it returns its jobs (all chunks combined for streaming scrapers)
+# - ("failed", exception) when it raises or is unknown
+# A slow or failing platform never holds back the results of the others
+# --------------------------------------------
+def run_scrapers(platforms, job_title, location, num_jobs, remote_option, date_posted, job_type):
+    events = queue.Queue()
+
+    def run(platform):
+        events.put((platform, "started", None))
+        try:
+            args = (job_title, location, num_jobs, remote_option, date_posted, job_type)
+            start = time.perf_counter()
+            with METRICS.timer("scrape_seconds", platform=platform):
+                if platform in STREAMERS:
+                    chunks = []
+                    for chunk in resolve(STREAMERS[platform])(*args):
+                        chunks.append(chunk)
+                        events.put((platform, "rows", chunk))
+                    jobs_data = pd.concat(chunks, ignore_index=True) if chunks else pd.DataFrame()
+                else:
+                    jobs_data = resolve(SCRAPERS[platform])(*args)
+            METRICS.inc("scraped_jobs_total", len(jobs_data), platform=platform)
+            print(f"Scraped {len(jobs_data)} jobs from {platform} in {time.perf_counter() - start:.1f}s")
+            events.put((platform, "done", jobs_data))
+        except Exception as e:
+            events.put((platform, "failed", e))
+
+    if not platforms:
+        return
+
+    executor = ThreadPoolExecutor(max_workers=len(platforms))
+    try:
+        for platform in platforms:
+            executor.submit(run, platform)
+
+        finished = 0
+        while finished < len(platforms):
+            event = events.get()
+            if event[1] in ("done", "failed"):
+                finished += 1
+            yield event
+    finally:
+        # Do not wait on scrapers that are still running if the caller stops early
+        executor.shutdown(wait=False)
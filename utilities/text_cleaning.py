@@ -0,0 +1,38 @@
+import html
+import re
+
+import pandas as pd
+
+# --------------------------------------------
+# Precompiled patterns for turning job description HTML into plain text
+# - MARKUP_PATTERN removes, in one pass: <script>/<style> blocks with their content,
+#   HTML comments and any remaining tag
+# Whitespace (including decoded &nbsp;) is collapsed with str.split/join, which is several
+# times faster than re.sub(r"\s+", " ", ...) and splits on the same characters
+# --------------------------------------------
+MARKUP_PATTERN = re.compile(r"<(script|style)\b[^>]*>.*?</\1\s*>|<!--.*?-->|<[^>]+>", re.IGNORECASE | re.DOTALL)
+
+
+# --------------------------------------------
+# Function to clean a single job description:
+# - Removes script/style blocks, comments and HTML tags
+# - Decodes HTML entities (&amp;, &nbsp;, &#39;, ...)
+# - Collapses multiple spaces and newlines
+# --------------------------------------------
+def clean_job_description(text):
+    text = MARKUP_PATTERN.sub(" ", text)
+    if "&" in text:
+        text = html.unescape(text)
+    return " ".join(text.split())
+
+
+# --------------------------------------------
+# clean_job_description applied to a whole column of descriptions
+# pandas .str.replace runs the regex row by row as well, so a plain loop over the scalar
+# cleaner is the fastest option (see benchmarks/bench_text_cleaning.py)
+# Missing values become empty strings; returns a new Series with the same index
+# --------------------------------------------
+def normalize_descriptions(descriptions):
+    text = descriptions.fillna("").astype(str)
+    return pd.Series([clean_job_description(description) for description in text],
+                     index=descriptions.index, dtype=object)